@@ -17,6 +17,12 @@ class UIConstants:
     UI_UPDATE_INTERVAL_MS = 1000
     SETTINGS_SAVE_DEBOUNCE_MS = 1000
     MENU_HIDE_DELAY_MS = 500
+    # Mouse polling backs off while the menu bar is hidden and the user is idle
+    MOUSE_POLL_INTERVAL_MS = 200
+    MOUSE_POLL_IDLE_INTERVAL_MS = 1000
+    MOUSE_POLL_LONG_IDLE_INTERVAL_MS = 5000
+    MOUSE_POLL_IDLE_SEC = 5
+    MOUSE_POLL_LONG_IDLE_SEC = 60
     
     # Mouse and interaction
     MENU_SHOW_THRESHOLD_Y = 30
@@ -28,6 +34,8 @@ class UIConstants:
     CARD_RESIZE_HANDLE_SIZE = 10
     TIMELINE_GRANULARITY_HOUR = 60
     TIMELINE_GRANULARITY_5MIN = 5
+    # Canvas tag shared by every item that moves when the view scrolls
+    SCROLLABLE_TAG = "scrollable"
 
 
 class Colors:
@@ -49,7 +57,6 @@ class Colors:
     CARD_OUTLINE = "black"
     CARD_PROGRESS_FILL = "green"
     CARD_PROGRESS_OUTLINE = "black"
-    CARD_PROGRESS_FILL_NO_OUTLINE = "green"
     CARD_BEING_MODIFIED_STIPPLE = "gray25"
     CARD_DISABLED_TEXT = "#cccccc"
     CARD_LABEL_TEXT = "black"
@@ -3,6 +3,7 @@ Schedule and Task models for business logic separation.
 Contains data structures and operations for managing tasks and schedules.
 """
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, time
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
@@ -59,11 +60,12 @@ class ScheduledActivity:
     
     def is_active_at(self, current_time: time) -> bool:
         """Check if this activity is active at the given time."""
-        # Handle activities that span past midnight (e.g., 23:30 to 01:30)
-        if self.end_time_obj < self.start_time_obj:  # Activity crosses midnight
-            return current_time >= self.start_time_obj or current_time < self.end_time_obj
-        else:
-            return self.start_time_obj <= current_time < self.end_time_obj
+        # Handles activities that span past midnight (e.g., 23:30 to 01:30)
+        return TimeUtils.is_seconds_in_range(
+            current_time.hour * 3600 + current_time.minute * 60 + current_time.second,
+            TimeUtils.seconds_since_midnight(self.start_time),
+            TimeUtils.seconds_since_midnight(self.end_time)
+        )
     
     def is_finished_at(self, current_time: time) -> bool:
         """Check if this activity is finished at the given time."""
@@ -103,6 +105,10 @@ class Schedule:
     def __init__(self, activities: Optional[List[Dict[str, Any]]] = None):
         """Initialize schedule with optional list of activity dictionaries."""
         self._activities: List[ScheduledActivity] = []
+        # Start of each activity in seconds since midnight, parallel to _activities
+        self._starts: List[int] = []
+        # Upper bound on any activity's length in seconds, bounds the lookup window
+        self._max_duration = 0
         if activities:
             self.load_from_dicts(activities)
     
@@ -112,8 +118,14 @@ class Schedule:
         self._sort_activities()
     
     def _sort_activities(self) -> None:
-        """Sort activities by start time."""
-        self._activities.sort(key=lambda a: a.start_time_obj)
+        """Sort activities by start time and refresh the start time index."""
+        self._activities.sort(key=lambda a: TimeUtils.seconds_since_midnight(a.start_time))
+        self._starts = [TimeUtils.seconds_since_midnight(a.start_time) for a in self._activities]
+        self._max_duration = max(
+            ((TimeUtils.seconds_since_midnight(a.end_time) - start) % 86400
+             for a, start in zip(self._activities, self._starts)),
+            default=0
+        )
     
     @property
     def activities(self) -> List[ScheduledActivity]:
@@ -128,23 +140,36 @@ class Schedule:
     def remove_activity(self, activity: ScheduledActivity) -> bool:
         """Remove an activity from the schedule. Returns True if removed."""
         try:
-            self._activities.remove(activity)
-            return True
+            index = self._activities.index(activity)
         except ValueError:
             return False
+        del self._activities[index]
+        del self._starts[index]
+        # _max_duration stays a valid upper bound
+        return True
     
     def get_current_activity(self, current_time: time) -> Optional[ScheduledActivity]:
-        """Get the currently active activity at the given time."""
-        for activity in self._activities:
-            if activity.is_active_at(current_time):
-                return activity
+        """Get the first activity, in start time order, active at the given time."""
+        now_seconds = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+        # Activities may overlap, but one active now started at most
+        # _max_duration ago: earlier today, or yesterday if it runs past
+        # midnight. Yesterday's starts sort after today's, keeping the order.
+        started_today_end = bisect_right(self._starts, now_seconds)
+        candidates = (
+            range(bisect_left(self._starts, now_seconds - self._max_duration), started_today_end),
+            range(max(bisect_left(self._starts, now_seconds - self._max_duration + 86400), started_today_end), len(self._starts))
+        )
+        for indices in candidates:
+            for index in indices:
+                if self._activities[index].is_active_at(current_time):
+                    return self._activities[index]
         return None
     
     def get_next_activity(self, current_time: time) -> Optional[ScheduledActivity]:
         """Get the next scheduled activity after the given time."""
-        for activity in self._activities:
-            if activity.start_time_obj > current_time:
-                return activity
+        index = bisect_right(self._starts, current_time.hour * 3600 + current_time.minute * 60 + current_time.second)
+        if index < len(self._activities):
+            return self._activities[index]
         return None
     
     def get_activities_in_range(self, start_time: time, end_time: time) -> List[ScheduledActivity]:
@@ -159,6 +184,8 @@ class Schedule:
     def clear(self) -> None:
         """Remove all activities from the schedule."""
         self._activities.clear()
+        self._starts.clear()
+        self._max_duration = 0
     
     def to_dicts(self) -> List[Dict[str, Any]]:
         """Convert schedule to list of dictionaries for serialization."""
@@ -10,6 +10,7 @@ from utils.logging import log_debug, log_info, log_error
 import utils.notification
 import utils.config
 from constants import NotificationConstants
+import queue
 import threading
 
 
@@ -32,6 +33,13 @@ class NotificationService:
         # Default advance notification settings (will be overridden by app)
         self.advance_notification_enabled = True
         self.advance_notification_seconds = NotificationConstants.DEFAULT_ADVANCE_WARNING_SECONDS
+        
+        # Pending (notification_data, notification_type, is_delayed) sends, handled
+        # in order by one worker thread started on first use
+        self._send_queue: queue.Queue = queue.Queue()
+        self._send_worker: Optional[threading.Thread] = None
+        # Guards the lazy start of _send_worker, so at most one is started
+        self._send_worker_lock = threading.Lock()
     
     def set_advance_notification_settings(self, enabled: bool, seconds: int) -> None:
         """Update advance notification settings.
@@ -113,21 +121,27 @@ class NotificationService:
     
     def _send_notification_async(self, notification_data: Dict, notification_type: str, is_delayed: bool = False) -> None:
         """
-        Send notification asynchronously in a separate thread to avoid blocking UI.
+        Queue a notification for the background sender thread to avoid blocking UI.
         
         Args:
             notification_data: Notification data to send
             notification_type: Type of notification for logging purposes
             is_delayed: Whether this is a delayed notification
         """
-        def _send_notification():
+        self._send_queue.put((notification_data, notification_type, is_delayed))
+        with self._send_worker_lock:
+            if self._send_worker is None:
+                self._send_worker = threading.Thread(target=self._send_notifications_worker, daemon=True)
+                self._send_worker.start()
+    
+    def _send_notifications_worker(self) -> None:
+        """Send queued notifications one at a time, for the lifetime of the app."""
+        while True:
+            notification_data, notification_type, is_delayed = self._send_queue.get()
             try:
                 utils.notification.send_gotify_notification(notification_data, is_delayed=is_delayed)
             except Exception as e:
                 log_error(f"Failed to send {notification_type} notification: {str(e)}")
-        
-        thread = threading.Thread(target=_send_notification, daemon=True)
-        thread.start()
     
     def _send_advance_notification(self, activity: ScheduledActivity) -> None:
         """Send advance notification for upcoming activity (non-blocking)."""
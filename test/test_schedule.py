@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for Schedule lookups of the current and next activity.
+Results must match a linear scan over the activities sorted by start time.
+"""
+
+from datetime import time
+from models.schedule import Schedule
+
+
+def _schedule(*ranges):
+    """Build a Schedule from (name, start_time, end_time) tuples."""
+    return Schedule([
+        {"name": name, "start_time": start, "end_time": end}
+        for name, start, end in ranges
+    ])
+
+
+def _name(activity):
+    return activity.name if activity else None
+
+
+def test_current_activity_without_overlap():
+    schedule = _schedule(("b", "10:00", "11:00"), ("a", "09:00", "10:00"), ("c", "12:00", "13:00"))
+
+    assert _name(schedule.get_current_activity(time(8, 59))) is None
+    assert _name(schedule.get_current_activity(time(9, 0))) == "a"
+    assert _name(schedule.get_current_activity(time(10, 0))) == "b"
+    assert _name(schedule.get_current_activity(time(11, 30))) is None
+    assert _name(schedule.get_current_activity(time(12, 59, 59))) == "c"
+    assert _name(schedule.get_current_activity(time(13, 0))) is None
+
+
+def test_current_activity_with_overlap():
+    # "short" starts later but "long" is still running around and after it
+    schedule = _schedule(("long", "09:00", "12:00"), ("short", "10:00", "10:30"))
+
+    assert _name(schedule.get_current_activity(time(9, 30))) == "long"
+    # Both are active: the earlier started one comes first
+    assert _name(schedule.get_current_activity(time(10, 15))) == "long"
+    # The latest started one has ended, the longer one has not
+    assert _name(schedule.get_current_activity(time(11, 0))) == "long"
+    assert _name(schedule.get_current_activity(time(12, 0))) is None
+
+
+def test_current_activity_crossing_midnight():
+    schedule = _schedule(("morning", "06:00", "08:00"), ("night", "23:00", "01:30"))
+
+    assert _name(schedule.get_current_activity(time(23, 30))) == "night"
+    assert _name(schedule.get_current_activity(time(0, 45))) == "night"
+    assert _name(schedule.get_current_activity(time(1, 30))) is None
+    assert _name(schedule.get_current_activity(time(7, 0))) == "morning"
+
+
+def test_current_activity_overlapping_midnight_crossing():
+    # "early" starts today before "night" wraps past midnight into it
+    schedule = _schedule(("early", "00:30", "02:00"), ("night", "22:00", "01:00"))
+
+    assert _name(schedule.get_current_activity(time(0, 15))) == "night"
+    # Both are active: "early" sorts first by start time
+    assert _name(schedule.get_current_activity(time(0, 45))) == "early"
+    assert _name(schedule.get_current_activity(time(1, 30))) == "early"
+
+
+def test_current_activity_after_remove_and_clear():
+    schedule = _schedule(("long", "09:00", "12:00"), ("short", "10:00", "10:30"))
+
+    assert schedule.remove_activity(schedule[0])
+    assert _name(schedule.get_current_activity(time(11, 0))) is None
+    assert _name(schedule.get_current_activity(time(10, 15))) == "short"
+
+    schedule.clear()
+    assert schedule.get_current_activity(time(10, 15)) is None
+
+
+def test_next_activity():
+    schedule = _schedule(("a", "09:00", "10:00"), ("b", "10:00", "11:00"))
+
+    assert _name(schedule.get_next_activity(time(8, 0))) == "a"
+    assert _name(schedule.get_next_activity(time(9, 0))) == "b"
+    assert _name(schedule.get_next_activity(time(10, 0))) is None
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for CardTimeIndex, the binary search lookup of the active task card.
+Cards are built without a canvas; the index only uses their times.
+"""
+
+from datetime import time
+from ui.task_card import TaskCard, CardTimeIndex
+
+
+def _cards(*ranges):
+    """Build undrawn TaskCards from (name, start_time, end_time) tuples."""
+    return [
+        TaskCard({"name": name, "start_time": start, "end_time": end, "description": []}, 6, 60, 0, 400)
+        for name, start, end in ranges
+    ]
+
+
+def _linear_active(cards, now):
+    return next((card for card in cards if card.is_active_at(now)), None)
+
+
+def test_find_active_matches_linear_scan():
+    cards = _cards(
+        ("c", "10:30", "11:00"),
+        ("a", "08:00", "09:00"),
+        ("b", "09:00", "10:15"),
+        ("night", "23:30", "01:00"),
+    )
+    index = CardTimeIndex()
+
+    for hour in range(24):
+        for minute in range(0, 60, 5):
+            now = time(hour, minute)
+            assert index.find_active(cards, hour * 60 + minute) is _linear_active(cards, now), now
+
+
+def test_find_active_crossing_midnight():
+    cards = _cards(("morning", "06:00", "07:00"), ("night", "23:30", "01:00"))
+    index = CardTimeIndex()
+
+    assert index.find_active(cards, 23 * 60 + 45).activity["name"] == "night"
+    assert index.find_active(cards, 30).activity["name"] == "night"
+    assert index.find_active(cards, 60) is None
+    assert index.find_active(cards, 5 * 60) is None
+
+
+def test_find_active_with_overlap_returns_an_active_card():
+    # Overlaps are allowed: the latest started active card is returned, callers
+    # looking for a specific activity check its id and fall back to a scan
+    cards = _cards(("long", "09:00", "12:00"), ("short", "10:00", "10:30"))
+    index = CardTimeIndex()
+
+    assert index.find_active(cards, 10 * 60 + 15).activity["name"] == "short"
+    assert index.find_active(cards, 9 * 60 + 30).activity["name"] == "long"
+
+
+def test_find_active_rebuilds_when_cards_change():
+    cards = _cards(("a", "08:00", "09:00"))
+    index = CardTimeIndex()
+    assert index.find_active(cards, 8 * 60 + 30).activity["name"] == "a"
+
+    cards += _cards(("b", "09:00", "10:00"))
+    assert index.find_active(cards, 9 * 60 + 30).activity["name"] == "b"
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for TimeUtils rounding, parsing and range helpers.
+Expected values are those of the original float/split based implementations.
+"""
+
+from datetime import datetime
+from utils.time_utils import TimeUtils, get_current_activity, round_to_nearest_5_minutes
+
+
+def test_round_to_nearest_5_minutes_matches_float_rounding():
+    for minutes in range(-1440, 1441):
+        assert round_to_nearest_5_minutes(minutes) == 5 * round(minutes / 5), minutes
+
+
+def test_round_to_nearest_5_minutes_examples():
+    assert round_to_nearest_5_minutes(0) == 0
+    assert round_to_nearest_5_minutes(2) == 0
+    assert round_to_nearest_5_minutes(3) == 5
+    assert round_to_nearest_5_minutes(12) == 10
+    assert round_to_nearest_5_minutes(13) == 15
+    assert round_to_nearest_5_minutes(58) == 60
+    assert round_to_nearest_5_minutes(-3) == -5
+
+
+def test_normalize_time_format_carries_into_hour_and_wraps():
+    assert TimeUtils.normalize_time_format(datetime(2025, 1, 1, 9, 2)) == "09:00"
+    assert TimeUtils.normalize_time_format(datetime(2025, 1, 1, 9, 58)) == "10:00"
+    assert TimeUtils.normalize_time_format(datetime(2025, 1, 1, 23, 58)) == "00:00"
+
+
+def _parse_error(time_str):
+    try:
+        TimeUtils.parse_time_with_validation(time_str)
+    except ValueError as e:
+        return str(e)
+    raise AssertionError(f"{time_str!r} was accepted")
+
+
+def test_parse_time_valid_forms():
+    parse = TimeUtils.parse_time_with_validation
+    assert (parse("9:05").hour, parse("9:05").minute) == (9, 5)
+    assert parse("09:05:07").second == 7
+    assert parse(" 23:59 ").minute == 59
+    assert parse("00:00").hour == 0
+    # Forms int() accepts were valid before the regex fast path and still are
+    assert parse("009:00").hour == 9
+    assert parse("+9:05").hour == 9
+
+
+def test_parse_time_out_of_range_messages():
+    assert _parse_error("123:00") == "Hour 123 out of range (0-24)"
+    assert _parse_error("9:075") == "Minute 75 out of range (0-59)"
+    assert _parse_error("12:60") == "Minute 60 out of range (0-59)"
+    assert _parse_error("9:05:60") == "Second 60 out of range (0-59)"
+
+
+def test_parse_time_malformed_messages():
+    assert _parse_error("") == "Time string cannot be empty"
+    assert _parse_error("   ") == "Time string cannot be empty"
+    assert _parse_error("ab:cd") == "Invalid time format: ab:cd. All parts must be numbers"
+    assert _parse_error("12:5a") == "Invalid time format: 12:5a. All parts must be numbers"
+    assert _parse_error("12") == "Invalid time format: 12. Expected 'HH:MM' or 'HH:MM:SS'"
+    assert _parse_error("1:2:3:4") == "Invalid time format: 1:2:3:4. Expected 'HH:MM' or 'HH:MM:SS'"
+    assert _parse_error(930).startswith("Time must be a string")
+
+
+def test_parse_time_caches_results_but_not_errors():
+    parse = TimeUtils.parse_time_with_validation
+    assert parse("07:45") is parse("07:45")
+    # A failed parse is not cached and fails again
+    assert _parse_error("07:75") == _parse_error("07:75")
+
+
+def test_seconds_since_midnight():
+    assert TimeUtils.seconds_since_midnight("00:00") == 0
+    assert TimeUtils.seconds_since_midnight("09:05:07") == 9 * 3600 + 5 * 60 + 7
+    assert TimeUtils.seconds_since_midnight("23:59") == 23 * 3600 + 59 * 60
+    assert _parse_error("25:00") == "Hour 25 out of range (0-24)"
+
+
+def test_is_time_in_range_crossing_midnight():
+    in_range = TimeUtils.is_time_in_range
+    assert in_range(datetime(2025, 1, 1, 9, 0).time(), "09:00", "10:00")
+    assert not in_range(datetime(2025, 1, 1, 10, 0).time(), "09:00", "10:00")
+    assert in_range(datetime(2025, 1, 1, 23, 45).time(), "23:30", "01:00")
+    assert in_range(datetime(2025, 1, 1, 0, 59, 59).time(), "23:30", "01:00")
+    assert not in_range(datetime(2025, 1, 1, 1, 0).time(), "23:30", "01:00")
+
+
+def test_calculate_duration_minutes():
+    assert TimeUtils.calculate_duration_minutes("09:00", "10:30") == 90
+    assert TimeUtils.calculate_duration_minutes("23:00", "01:00") == 120
+    assert TimeUtils.calculate_duration_minutes("09:15:59", "10:00") == 45
+
+
+def test_get_current_activity_first_match_in_list_order():
+    schedule = [
+        {"name": "long", "start_time": "09:00", "end_time": "12:00"},
+        {"name": "short", "start_time": "10:00", "end_time": "10:30"},
+        {"name": "night", "start_time": "23:30", "end_time": "01:00"},
+    ]
+    assert get_current_activity(schedule, datetime(2025, 1, 1, 10, 15))["name"] == "long"
+    assert get_current_activity(schedule[1:], datetime(2025, 1, 1, 10, 15))["name"] == "short"
+    assert get_current_activity(schedule, datetime(2025, 1, 1, 0, 30))["name"] == "night"
+    assert get_current_activity(schedule, datetime(2025, 1, 1, 12, 0)) is None
+    # Callers get a copy they may modify
+    assert get_current_activity(schedule, datetime(2025, 1, 1, 9, 0)) is not schedule[0]
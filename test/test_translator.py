@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for Translator lookups and the list of available languages.
+"""
+
+import json
+import os
+import shutil
+from utils.translator import Translator
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'locales')
+
+
+def test_available_languages_skip_files_that_cannot_load(tmp_path):
+    shutil.copy(os.path.join(LOCALES_DIR, 'en.json'), tmp_path)
+    # Valid "_meta" section followed by a broken body
+    (tmp_path / 'xx.json').write_text('{"_meta": {"display_name": "X"}, "window": {broken', encoding='utf-8')
+    (tmp_path / 'yy.json').write_text('[]', encoding='utf-8')
+
+    translator = Translator('en', str(tmp_path))
+
+    assert translator.get_available_languages() == {'en': 'English'}
+    assert not translator.set_language('xx')
+
+
+def test_available_languages_use_display_name(tmp_path):
+    shutil.copy(os.path.join(LOCALES_DIR, 'en.json'), tmp_path)
+    (tmp_path / 'xx.json').write_text(json.dumps({"window": {"main_title": "X"}}), encoding='utf-8')
+
+    translator = Translator('en', str(tmp_path))
+
+    assert translator.get_available_languages() == {'en': 'English', 'xx': 'XX'}
+    assert translator.set_language('xx')
+    assert translator.t('window.main_title') == 'X'
+
+
+def test_fallback_to_english_for_missing_keys(tmp_path):
+    shutil.copy(os.path.join(LOCALES_DIR, 'en.json'), tmp_path)
+    (tmp_path / 'xx.json').write_text(json.dumps({"window": {"main_title": "X"}}), encoding='utf-8')
+
+    translator = Translator('xx', str(tmp_path))
+    english = Translator('en', str(tmp_path))
+
+    assert translator.t('window.main_title') == 'X'
+    assert translator.t('window.global_options') == english.t('window.global_options')
+    assert translator.t('no.such.key') == 'no.such.key'
@@ -11,8 +11,8 @@ import utils.notification
 from services.notification_service import NotificationService
 from utils.translator import init_translator, t
 
-from ui.timeline import draw_timeline, draw_current_time_line, reposition_current_time_line
-from ui.task_card import create_task_cards, TaskCard
+from ui.timeline import draw_timeline, draw_current_time_line, reposition_current_time_line, reposition_timeline
+from ui.task_card import create_task_cards, TaskCard, CardTimeIndex
 from utils.time_utils import parse_time_str
 from datetime import datetime, timedelta, time
 from utils.logging import log_debug, log_info, log_error
@@ -22,7 +22,7 @@ from ui.app_ui_loop import update_ui
 from ui.app_card_handling import on_card_press, on_card_drag, on_card_release, on_card_motion
 from ui.schedule_management import open_schedule, save_schedule_as, save_schedule, clear_schedule
 from ui.context_menu import show_canvas_context_menu
-from ui.zoom_and_scroll import move_timelines_and_cards, poll_mouse
+from ui.zoom_and_scroll import move_timelines_and_cards, poll_mouse, scroll, flush_view_update
 from services.task_tracking_service import TaskTrackingService
 from ui.statistics_dialog import open_task_statistics_dialog
 from constants import NotificationConstants
@@ -135,8 +135,7 @@ class TimeboxApp(tk.Tk):
         # Restore window position if available
         if "window_position" in self.settings:
             self.geometry(self.settings["window_position"])
-        utils.notification.gotify_token = self.settings.get("gotify_token", "")
-        utils.notification.gotify_url = self.settings.get("gotify_url", "")
+        utils.notification.configure_gotify(self.settings.get("gotify_url", ""), self.settings.get("gotify_token", ""))
         self.title(t("window.main_title"))
         self.geometry("400x700")
         self.start_hour = self.day_start
@@ -144,11 +143,25 @@ class TimeboxApp(tk.Tk):
         self.pixels_per_hour = max(50, int(50 * self.zoom_factor))
         self.offset_y = 0
         self.cards = []  # List[TaskCard]
+        self.card_time_index = CardTimeIndex()  # Sorted start times of self.cards for active card lookup
         self.timeline_1h_ids = []
         self.timeline_5m_ids = []
         self.current_time_ids = []
+        # Text shown by the current time item, see reposition_current_time_line
+        self.current_time_text = None
+        # Hidden timelines skipped by the last resize, see show_timeline
+        self._stale_timeline_granularities = set()
+        # Layout last applied by resize_timelines_and_cards
+        self._last_resize_state = None
+        # Time of the previous UI tick, None until the first one
+        self._last_ui_update = None
+        self._day_rollover_dialog_active = False
         self._drag_data = {"item_ids": [], "offset_y": 0, "start_y": 0, "dragging": False, "resize_mode": None}
         self._last_size = (self.winfo_width(), self.winfo_height())
+        # Wheel zoom/scroll changes waiting for the idle redraw, see ui.zoom_and_scroll
+        self._pending_scroll_dy = 0
+        self._pending_zoom = False
+        self._view_update_scheduled = False
         self.timeline_granularity = 60
         self.menu_hide_job = None
         self.last_action = datetime.now()
@@ -212,13 +225,17 @@ class TimeboxApp(tk.Tk):
         self.activity_label = tk.Label(self, font=("Arial", 12), anchor="w", justify="left", bg=Colors.ACTIVITY_LABEL_BG, fg=Colors.ACTIVITY_LABEL_TEXT, relief="solid", bd=2)
         self.activity_label.place(x=10, y=40, width=380)
         self._activity_label_full_text = ""  # Store full text for truncation on resize
+        # Measuring font and recent truncations, see set_activity_label_text
+        self._activity_label_font_spec = None
+        self._activity_label_font = None
+        self._activity_label_truncations = {}
         
         self.bind("<Configure>", lambda event: on_resize(self, event))
 
         # Center view on current time
         now = self.now_provider().time()
         minutes_since_start = (now.hour - self.start_hour) * 60 + now.minute
-        center_y = int(minutes_since_start * self.pixels_per_hour / 60) + 100
+        center_y = minutes_since_start * self.pixels_per_hour // 60 + 100
         
         # both these calls are needed to ensure the correct offset_y is calculated
         self.offset_y = (self.winfo_height() // 2) - center_y
@@ -265,6 +282,7 @@ class TimeboxApp(tk.Tk):
         """Create current time line visualization."""
         now = self.now_provider().time()
         mouse_inside = self._is_mouse_inside_window()
+        self.current_time_text = None
         return draw_current_time_line(
             self.canvas, self.winfo_width(), self.start_hour, self.pixels_per_hour, self.offset_y,
             current_time=now, mouse_inside_window=mouse_inside
@@ -273,8 +291,7 @@ class TimeboxApp(tk.Tk):
     def _is_mouse_inside_window(self):
         """Check if mouse is inside the window area."""
         try:
-            mouse_x = self.winfo_pointerx()
-            mouse_y = self.winfo_pointery()
+            mouse_x, mouse_y = self.winfo_pointerxy()
             window_x = self.winfo_rootx()
             window_y = self.winfo_rooty()
             window_width = self.winfo_width()
@@ -287,19 +304,20 @@ class TimeboxApp(tk.Tk):
 
     def show_timeline(self, granularity=60):
         """Show only the timeline with the given granularity."""
-        for tid in getattr(self, 'timeline_1h_ids', []):
+        # Apply pending wheel changes first, they may lay out this timeline anyway
+        flush_view_update(self)
+        if granularity in self._stale_timeline_granularities:
+            self._stale_timeline_granularities.discard(granularity)
+            timeline_ids = self.timeline_1h_ids if granularity == 60 else self.timeline_5m_ids
+            reposition_timeline(self.canvas, timeline_ids, self.pixels_per_hour, self.offset_y, self.winfo_width(), granularity=granularity)
+        for tid in self.timeline_1h_ids:
             self.canvas.itemconfig(tid, state="normal" if granularity == 60 else "hidden")
-        for tid in getattr(self, 'timeline_5m_ids', []):
+        for tid in self.timeline_5m_ids:
             self.canvas.itemconfig(tid, state="normal" if granularity == 5 else "hidden")
     
     def scroll(self, event, delta: int):
         """Handle scroll events."""
-        log_debug(f"Scrolling: {delta}, PPH: {self.pixels_per_hour}, Current Offset Y: {self.offset_y}")
-        if self.pixels_per_hour > 50:
-            scroll_step = -40 if delta > 0 else 40
-            self.offset_y += scroll_step
-            move_timelines_and_cards(self, scroll_step)
-            self.last_action = datetime.now()
+        scroll(self, event, delta)
 
     def create_task_cards(self):
         """Create task cards from schedule."""
@@ -325,14 +343,17 @@ class TimeboxApp(tk.Tk):
         # Only center if auto-centering is enabled (disable_auto_centering is False)
         if center and not getattr(self, 'disable_auto_centering', False):
             minutes_since_start = (now.hour - self.start_hour) * 60 + now.minute
-            center_y = int(minutes_since_start * self.pixels_per_hour / 60) + 100
+            center_y = minutes_since_start * self.pixels_per_hour // 60 + 100
             new_offset = (height // 2) - center_y
             delta_y = new_offset - self.offset_y
             self.offset_y = new_offset
             move_timelines_and_cards(self, delta_y)
-        else:
-            # Even when not centering, always update card visuals (progress bars, etc.)
-            for card_obj in self.cards:
+        
+        # Only cards whose progress or color depends on the passing time need an update;
+        # layout changes go through update_cards_after_size_change instead
+        now_mod = now.hour * 60 + now.minute
+        for card_obj in self.cards:
+            if card_obj.needs_time_refresh(now_mod):
                 card_obj.update_card_visuals(
                     card_obj.start_hour, card_obj.start_minute, 
                     self.start_hour, self.pixels_per_hour, self.offset_y, 
@@ -347,6 +368,7 @@ class TimeboxApp(tk.Tk):
     def restore_card_visuals(self):
         """Restore visuals of all cards after drag or resize."""
         now = self.now_provider().time()
+        width = self.winfo_width()
         for card_obj in self.cards:
             self.canvas.itemconfig(card_obj.card, stipple="")
             if card_obj.label:
@@ -358,7 +380,7 @@ class TimeboxApp(tk.Tk):
                 card_obj.update_card_visuals(
                     card_obj.start_hour, card_obj.start_minute, 
                     self.start_hour, self.pixels_per_hour, self.offset_y, 
-                    now=now, width=self.winfo_width()
+                    now=now, width=width
                 )
                 
         self.card_visual_changed = False
@@ -424,7 +446,7 @@ class TimeboxApp(tk.Tk):
             tasks_info = f"{schedule_name} | {tasks_info}"
         
         # Display logic: show warning if unsaved tasks, otherwise show statistics
-        log_debug(f"Status bar update: has_unsaved_tasks={has_unsaved_tasks}, tasks_info='{tasks_info}'")
+        log_debug("Status bar update: has_unsaved_tasks=%s, tasks_info='%s'", has_unsaved_tasks, tasks_info)
         if has_unsaved_tasks:
             log_debug("Triggering unsaved task warning display")
             self._show_unsaved_task_warning(tasks_info)
@@ -450,11 +472,11 @@ class TimeboxApp(tk.Tk):
             activity = card_obj.activity
             if self.task_tracking_service.has_unsaved_tasks(activity):
                 unsaved_tasks = self.task_tracking_service.get_unsaved_tasks(activity)
-                log_debug(f"Activity '{activity.get('name', 'Unknown')}' has unsaved tasks: {unsaved_tasks}")
+                log_debug("Activity '%s' has unsaved tasks: %s", activity.get('name', 'Unknown'), unsaved_tasks)
                 unsaved_count += len(unsaved_tasks)
         
         has_unsaved = unsaved_count > 0
-        log_debug(f"Total unsaved tasks found: {unsaved_count}, has_unsaved: {has_unsaved}")
+        log_debug("Total unsaved tasks found: %s, has_unsaved: %s", unsaved_count, has_unsaved)
         return has_unsaved
     
     def _show_unsaved_task_warning(self, normal_text: str):
@@ -504,10 +526,12 @@ class TimeboxApp(tk.Tk):
 
     def update_cards_after_size_change(self):
         """Update all cards after window size change."""
+        flush_view_update(self)
         now = self.now_provider().time()
+        width = self.winfo_width()
         for card_obj in self.cards:
             card_obj.update_card_visuals(
-                card_obj.start_hour, card_obj.start_minute, self.start_hour, self.pixels_per_hour, self.offset_y, now=now, width=self.winfo_width()
+                card_obj.start_hour, card_obj.start_minute, self.start_hour, self.pixels_per_hour, self.offset_y, now=now, width=width
             )
         #self.update_status_bar()
 
@@ -515,34 +539,38 @@ class TimeboxApp(tk.Tk):
         """Returns (next_task_dict, next_task_start_datetime) - the task closest in time after now."""
         if not self.schedule or len(self.schedule) == 0:
             return None, None
-        today = now.date()
-        tomorrow = today + timedelta(days=1)
+        # Compare in integer microseconds since midnight; the loop runs every tick,
+        # so datetimes are only built for the winning task
+        day_us = 24 * 3600 * 1_000_000
+        now_us = ((now.hour * 60 + now.minute) * 60 + now.second) * 1_000_000 + now.microsecond
         
         # Find task with smallest time difference from now (closest upcoming task)
         closest_task = None
-        closest_task_dt = None
+        closest_time = None
+        closest_is_tomorrow = False
         smallest_diff = None
         
         for task in self.schedule:
             t = parse_time_str(task['start_time'])
+            diff = ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 - now_us
             # Check task on today
-            task_dt = datetime.combine(today, t)
-            if task_dt > now:
-                diff = (task_dt - now).total_seconds()
+            if diff > 0:
                 if smallest_diff is None or diff < smallest_diff:
                     smallest_diff = diff
                     closest_task = task
-                    closest_task_dt = task_dt
+                    closest_time = t
+                    closest_is_tomorrow = False
             
             # Also check task on tomorrow (in case we're near end of day)
-            task_dt_tomorrow = datetime.combine(tomorrow, t)
-            diff_tomorrow = (task_dt_tomorrow - now).total_seconds()
+            diff_tomorrow = diff + day_us
             if smallest_diff is None or diff_tomorrow < smallest_diff:
                 smallest_diff = diff_tomorrow
                 closest_task = task
-                closest_task_dt = task_dt_tomorrow
+                closest_time = t
+                closest_is_tomorrow = True
         
-        return closest_task, closest_task_dt
+        day = now.date() + timedelta(days=1) if closest_is_tomorrow else now.date()
+        return closest_task, datetime.combine(day, closest_time)
 
     def on_cancel_callback(self, card_obj):
         """Callback for when the edit window is cancelled."""
@@ -700,6 +728,7 @@ class TimeboxApp(tk.Tk):
             
             # Update card visuals to reflect loaded task completion states
             now = self.now_provider().time()
+            width = self.winfo_width()
             for card_obj in self.cards:
                 # Only update visuals for cards in current schedule
                 activity_id = card_obj.activity.get("id")
@@ -721,7 +750,7 @@ class TimeboxApp(tk.Tk):
                         now=now,
                         show_start_time=(card_obj.start_minute != 0),
                         show_end_time=(card_obj.end_minute != 0),
-                        width=self.winfo_width(),
+                        width=width,
                         is_moving=False
                     )
             log_debug("Updated card visuals after loading task completion states")
@@ -790,7 +819,7 @@ class TimeboxApp(tk.Tk):
 
     def bind_mouse_actions(self, card):
         """Bind mouse actions to the card."""
-        tag = f"card_{card.card}"
+        tag = card.tag
         card._tasks_done_callback = self.update_status_bar
         self.canvas.tag_bind(tag, "<ButtonPress-1>", lambda event: on_card_press(self, event))
         self.canvas.tag_bind(tag, "<B1-Motion>", lambda event: on_card_drag(self, event))
@@ -3,12 +3,13 @@ from utils.logging import log_debug
 import tkinter as tk
 from datetime import datetime
 from constants import Colors
+from ui.zoom_and_scroll import flush_view_update
 
 
 def _set_card_manipulation_state(app, card_id: int, is_being_manipulated: bool):
     """Set the manipulation state for a card to control color alternation."""
     # Find the card object corresponding to the canvas item ID
-    for card_obj in getattr(app, 'cards', []):
+    for card_obj in app.cards:
         if card_obj.card == card_id:
             if is_being_manipulated:
                 card_obj._being_dragged = True
@@ -30,18 +31,18 @@ def _update_label_position(app, card_id: int):
     center_y = (y1 + y2) / 2
     
     # Find the card object and update its label and related element positions
-    for card_obj in getattr(app, 'cards', []):
+    for card_obj in app.cards:
         if card_obj.card == card_id:
             # Update main label (center of card)
             if card_obj.label:
                 app.canvas.coords(card_obj.label, center_x, center_y)
             # Update tasks count label (bottom-right corner)
-            if hasattr(card_obj, 'tasks_count_label') and card_obj.tasks_count_label:
+            if card_obj.tasks_count_label is not None:
                 app.canvas.coords(card_obj.tasks_count_label, x2 - 5, y2 - 5)
             # Update time labels (left side of card)
-            if hasattr(card_obj, 'time_start_label') and card_obj.time_start_label:
+            if card_obj.time_start_label is not None:
                 app.canvas.coords(card_obj.time_start_label, x1 - 10, y1)
-            if hasattr(card_obj, 'time_end_label') and card_obj.time_end_label:
+            if card_obj.time_end_label is not None:
                 app.canvas.coords(card_obj.time_end_label, x1 - 10, y2)
             break
 
@@ -78,18 +79,20 @@ def on_card_drag(app, event):
         y_relative = y - 100 - app.offset_y - app._drag_data["diff_y"]
         total_minutes = int(y_relative * 60 / app.pixels_per_hour)
         snapped_minutes = round_to_nearest_5_minutes(total_minutes)
-        log_debug(f"Snapped minutes: {snapped_minutes}")
+        log_debug("Snapped minutes: %s", snapped_minutes)
         snapped_y = int(snapped_minutes * app.pixels_per_hour / 60) + 100 + app.offset_y
         delta_y = snapped_y - app.canvas.coords(dragged_id)[1]
-        log_debug(f"Item_ids: {app._drag_data['item_ids']}")
+        log_debug("Item_ids: %s", app._drag_data['item_ids'])
         for item_id in app._drag_data["item_ids"]:
             app.canvas.move(item_id, 0, delta_y)
         app._drag_data["offset_y"] = event.y + (snapped_y - y)
 
 def on_card_press(app, event):
     """Handle card press event."""
+    # Drag math reads item coords, so apply any wheel scroll still waiting for idle
+    flush_view_update(app)
     tags = app.canvas.gettags(tk.CURRENT)
-    log_debug(f"Card pressed: {tags}")
+    log_debug("Card pressed: %s", tags)
     app._drag_data["item_ids"] = app.canvas.find_withtag(tags[0])
     app._drag_data["offset_y"] = event.y
     app._drag_data["start_y"] = event.y
@@ -98,7 +101,7 @@ def on_card_press(app, event):
     dragged_id = app._drag_data["item_ids"][0]
     y_card_top = app.canvas.coords(dragged_id)[1]
     app._drag_data["diff_y"] = event.y - y_card_top
-    log_debug(f"Dragging card: {dragged_id}, Tags: {tags}")
+    log_debug("Dragging card: %s, Tags: %s", dragged_id, tags)
     # Detect if click is near top or bottom for resize
     y_card_top = app.canvas.coords(dragged_id)[1]
     y_card_bottom = app.canvas.coords(dragged_id)[3]
@@ -155,12 +158,12 @@ def on_card_release(app, event):
 def handle_card_snap(app, card_id: int, y: int):
     """Handle card snap event."""
     moved_card = next(card for card in app.cards if card.card == card_id)
-    log_debug(f"Moved card: {moved_card.card}")
+    log_debug("Moved card: %s", moved_card.card)
     y_relative = y - 100 - app.offset_y - app._drag_data["diff_y"]
     total_minutes = round_to_nearest_5_minutes(int(y_relative * 60 / app.pixels_per_hour))
     new_hour = (app.start_hour + total_minutes // 60) % 24
     new_minute = total_minutes % 60
-    log_debug(f"Moving card {moved_card.activity['name']} to {new_hour:02d}:{new_minute:02d}")
+    log_debug("Moving card %s to %02d:%02d", moved_card.activity['name'], new_hour, new_minute)
     idx = app.cards.index(moved_card)
     allow_end_time_label = True
     if idx < len(app.cards) - 1:
@@ -224,7 +227,7 @@ def handle_card_resize(app, card_id: int, y: int, mode: str):
 def on_card_motion(app, event):
     """Handle card motion event."""
     tags = app.canvas.gettags(tk.CURRENT)
-    log_debug(f"Tags = {tags}")
+    log_debug("Tags = %s", tags)
     if not tags:
         app.config(cursor="")
         return
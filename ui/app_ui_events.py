@@ -59,7 +59,7 @@ def on_resize(app, event):
 def on_mouse_wheel(app, event):
     """Handle mouse wheel event."""
     ctrl_held = (event.state & 0x0004) != 0
-    log_debug(f"Mouse Wheel Event: {event.num}, Delta: {event.delta}, Ctrl Held: {ctrl_held}")
+    log_debug("Mouse Wheel Event: %s, Delta: %s, Ctrl Held: %s", event.num, event.delta, ctrl_held)
     delta = 0
     if event.num == 4 or event.delta > 0:  # Scroll up
         delta = -1
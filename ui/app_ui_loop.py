@@ -5,6 +5,7 @@ from typing import Dict, Optional
 from constants import UIConstants
 from models.schedule import ScheduledActivity
 from ui.timeline import reposition_current_time_line
+from ui.zoom_and_scroll import flush_view_update
 import os
 import yaml
 from utils.locale_utils import get_weekday_name
@@ -73,21 +74,55 @@ def truncate_text_to_width(text: str, font, max_width: int) -> str:
                 # Find how many characters fit
                 available_width = max_width - ellipsis_width
                 
-                # Simple character-by-character truncation
-                truncated = line
-                for i in range(len(line), 0, -1):
-                    test_text = line[:i]
-                    if font.measure(test_text) <= available_width:
-                        truncated = test_text + ellipsis
-                        break
-                else:
-                    truncated = ellipsis
+                # Binary search for the longest fitting prefix; prefix widths
+                # only grow with length and each measure() is a Tk call
+                low, high = 0, len(line) - 1  # the whole line is known not to fit
+                while low < high:
+                    mid = (low + high + 1) // 2
+                    if font.measure(line[:mid]) <= available_width:
+                        low = mid
+                    else:
+                        high = mid - 1
+                truncated = line[:low] + ellipsis
                 
                 truncated_lines.append(truncated)
     
     return '\n'.join(truncated_lines)
 
 
+_ACTIVITY_LABEL_TRUNCATIONS_MAX_SIZE = 64
+
+def set_activity_label_text(app, full_text: str) -> None:
+    """
+    Show full_text in the activity label, truncated to the label's width.
+    
+    The measuring font is cached on the app per font spec, and so are recent
+    truncation results per (text, width): every font.measure() is a Tk call
+    and this runs on each UI tick and resize.
+    
+    Args:
+        app: The main TimeboxApp instance
+        full_text: Untruncated label text, kept for re-truncation on resize
+    """
+    spec = app.activity_label['font']
+    if spec != app._activity_label_font_spec:
+        app._activity_label_font_spec = spec
+        app._activity_label_font = tkfont.Font(font=spec)
+        app._activity_label_truncations.clear()
+    # Account for padding and border (approx 10px on each side)
+    available_width = max(app.activity_label.winfo_width() - 20, 50)
+    truncations = app._activity_label_truncations
+    key = (full_text, available_width)
+    truncated_text = truncations.get(key)
+    if truncated_text is None:
+        truncated_text = truncate_text_to_width(full_text, app._activity_label_font, available_width)
+        if len(truncations) >= _ACTIVITY_LABEL_TRUNCATIONS_MAX_SIZE:
+            truncations.clear()
+        truncations[key] = truncated_text
+    app.activity_label.config(text=truncated_text)
+    app._activity_label_full_text = full_text  # Store for resize
+
+
 def update_ui(app):
     """
     Main UI update loop that refreshes all time-dependent UI elements.
@@ -103,25 +138,34 @@ def update_ui(app):
         app: The main TimeboxApp instance containing all UI state and components
     """
     # Pause updates if day rollover dialog is being shown
-    if getattr(app, '_day_rollover_dialog_active', False):
+    if app._day_rollover_dialog_active:
         app.after(UIConstants.UI_UPDATE_INTERVAL_MS, lambda: update_ui(app))
         return
     
+    # Card positions must match offset_y before anything below relies on them
+    flush_view_update(app)
+
     now = app.now_provider()
     
     # Check for day rollover and handle it
     _check_and_handle_day_rollover(app, now)
     
+    # Window geometry and pointer are read once per tick; every winfo_* call is a Tcl round-trip
+    mouse_inside = _is_mouse_inside_window(app)
+    width = app.winfo_width()
+
     # Check if we need to update UI based on time changes
     activity = get_current_activity(app.schedule, now)
-    should_update = _should_update_ui(app, now, activity)
+    should_update = _should_update_ui(app, now, activity, mouse_inside)
     
     # Always update time display (lightweight operation)
     app.time_label.config(text=now.strftime("%H:%M:%S %A, %Y-%m-%d"))
     
     # Always update current time line position and format (lightweight operation)
-    mouse_inside = _is_mouse_inside_window(app)
-    reposition_current_time_line(app.canvas, app.current_time_ids, app.start_hour, app.pixels_per_hour, app.offset_y, app.winfo_width(), now.time(), mouse_inside)
+    app.current_time_text = reposition_current_time_line(
+        app.canvas, app.current_time_ids, app.start_hour, app.pixels_per_hour, app.offset_y, width, now.time(), mouse_inside,
+        shown_text=app.current_time_text
+    )
     
     next_task, next_task_start = app.get_next_task_and_time(now)
     
@@ -143,15 +187,7 @@ def update_ui(app):
         desc = "\n".join(f"{i+1}. {pt}" for i, pt in enumerate(activity["description"]))
         full_text = f"Actions:\n{desc}"
         
-        # Truncate text to fit label width
-        label_font = tkfont.Font(font=app.activity_label['font'])
-        label_width = app.activity_label.winfo_width()
-        # Account for padding and border (approx 10px on each side)
-        available_width = max(label_width - 20, 50)
-        truncated_text = truncate_text_to_width(full_text, label_font, available_width)
-        
-        app.activity_label.config(text=truncated_text)
-        app._activity_label_full_text = full_text  # Store for resize
+        set_activity_label_text(app, full_text)
         # Activity change notifications are now handled by the notification service
         app.last_activity = activity
     else:
@@ -167,37 +203,30 @@ def update_ui(app):
             minutes, seconds = divmod(remainder, 60)
             full_text = f"No active task\nNext: {next_task['name']} at {next_task['start_time']}\nTime left: {hours:02d}:{minutes:02d}:{seconds:02d}"
         
-        # Truncate text to fit label width
-        label_font = tkfont.Font(font=app.activity_label['font'])
-        label_width = app.activity_label.winfo_width()
-        # Account for padding and border (approx 10px on each side)
-        available_width = max(label_width - 20, 50)
-        truncated_text = truncate_text_to_width(full_text, label_font, available_width)
-        
-        app.activity_label.config(text=truncated_text)
-        app._activity_label_full_text = full_text  # Store for resize
+        set_activity_label_text(app, full_text)
 
     # Redraw timeline and cards if no action for threshold time or at the start of each minute
     if should_update:
         log_debug("Redrawing timeline and cards due to inactivity...")
-        app.redraw_timeline_and_cards(app.winfo_width(), app.winfo_height())
+        app.redraw_timeline_and_cards(width, app.winfo_height())
         if app.card_visual_changed:
             app.restore_card_visuals()
             app.card_visual_changed = False
     else:
-        _refresh_active_card_if_undone_tasks(app, activity)
-        _refresh_missed_cards_with_undone_tasks(app, app.now_provider().time())
+        current_time = now.time()
+        _refresh_active_card_if_undone_tasks(app, activity, current_time, width)
+        _refresh_missed_cards_with_undone_tasks(app, current_time, width)
 
     # Store last update time for optimization
     app._last_ui_update = now
     
-    # Update compact view if it's visible
+    # Update compact view if it's visible, reusing this tick's activity lookup
     if hasattr(app, 'compact_view') and app.compact_view.is_visible:
-        app.compact_view.update()
+        app.compact_view.update(activity)
         
     app.after(UIConstants.UI_UPDATE_INTERVAL_MS, lambda: update_ui(app))
 
-def _refresh_active_card_if_undone_tasks(app, activity):
+def _refresh_active_card_if_undone_tasks(app, activity, now, width):
     """
     Refresh only the currently active card to update visual indicators for undone tasks.
     
@@ -208,6 +237,8 @@ def _refresh_active_card_if_undone_tasks(app, activity):
     Args:
         app: The main TimeboxApp instance
         activity: Dictionary containing the current activity data, or None if no active task
+        now: Current time object
+        width: Current window width, read once per UI tick
     """
     if not activity:
         return
@@ -221,26 +252,33 @@ def _refresh_active_card_if_undone_tasks(app, activity):
     
     # Skip if activity is not in current schedule
     if not _is_activity_in_schedule(app, activity_id):
-        log_debug(f"Skipping refresh for activity '{activity.get('name')}' - not in current schedule")
+        log_debug("Skipping refresh for activity '%s' - not in current schedule", activity.get('name'))
         return
     
-    for card_obj in getattr(app, 'cards', []):
-        if activity_id and card_obj.activity.get('id') == activity_id:
-            # Use _tasks_done if present, otherwise assume all tasks are undone
-            tasks_done = getattr(card_obj, '_tasks_done', [False] * len(tasks))
-            if any(not done for done in tasks_done):
-                log_debug("Refreshing active card due to undone tasks")
-                card_obj.update_card_visuals(
-                    card_obj.start_hour,
-                    card_obj.start_minute,
-                    app.start_hour,
-                    app.pixels_per_hour,
-                    app.offset_y,
-                    now=app.now_provider().time(),
-                    width=app.winfo_width()
-                )
+    if not activity_id:
+        return
+    
+    # Binary search over card start times instead of scanning every card
+    card_obj = app.card_time_index.find_active(app.cards, now.hour * 60 + now.minute)
+    if card_obj is None or card_obj.activity.get('id') != activity_id:
+        # Overlapping cards: the index hit is the latest started one, which need
+        # not be the activity get_current_activity picked
+        card_obj = next((card for card in app.cards if card.activity.get('id') == activity_id), None)
+    if card_obj is not None:
+        # Without tracking data all tasks count as undone
+        if card_obj.done_task_count() < len(tasks):
+            log_debug("Refreshing active card due to undone tasks")
+            card_obj.update_card_visuals(
+                card_obj.start_hour,
+                card_obj.start_minute,
+                app.start_hour,
+                app.pixels_per_hour,
+                app.offset_y,
+                now=now,
+                width=width
+            )
 
-def _refresh_missed_cards_with_undone_tasks(app, now):
+def _refresh_missed_cards_with_undone_tasks(app, now, width):
     """
     Refresh cards for activities that have finished but have undone tasks.
     
@@ -255,13 +293,14 @@ def _refresh_missed_cards_with_undone_tasks(app, now):
     Args:
         app: The main TimeboxApp instance
         now: Current time object
+        width: Current window width, read once per UI tick
     """
-    for card_obj in getattr(app, 'cards', []):
+    for card_obj in app.cards:
         activity_id = card_obj.activity.get('id')
         
         # Skip if activity is not in current schedule
         if not _is_activity_in_schedule(app, activity_id):
-            log_debug(f"Skipping refresh for card '{card_obj.activity.get('name')}' - not in current schedule")
+            log_debug("Skipping refresh for card '%s' - not in current schedule", card_obj.activity.get('name'))
             continue
         
         tasks = card_obj.activity.get("tasks", [])
@@ -269,15 +308,12 @@ def _refresh_missed_cards_with_undone_tasks(app, now):
             continue
         
         # Check if card is finished (end time is before current time)
-        from datetime import time
-        end_time = time(card_obj.end_hour, card_obj.end_minute)
-        if end_time > now:
+        if card_obj._end_time > now:
             continue  # Card is not finished yet
         
         # Check if there are any undone tasks
-        tasks_done = getattr(card_obj, '_tasks_done', [False] * len(tasks))
-        if any(not done for done in tasks_done):
-            log_debug(f"Refreshing missed card '{card_obj.activity.get('name')}' due to undone tasks")
+        if card_obj.done_task_count() < len(tasks):
+            log_debug("Refreshing missed card '%s' due to undone tasks", card_obj.activity.get('name'))
             card_obj.update_card_visuals(
                 card_obj.start_hour,
                 card_obj.start_minute,
@@ -285,7 +321,7 @@ def _refresh_missed_cards_with_undone_tasks(app, now):
                 app.pixels_per_hour,
                 app.offset_y,
                 now=now,
-                width=app.winfo_width()
+                width=width
             )
 
 def _is_mouse_inside_window(app) -> bool:
@@ -301,20 +337,9 @@ def _is_mouse_inside_window(app) -> bool:
     Returns:
         bool: True if mouse is inside window boundaries, False otherwise or on error
     """
-    try:
-        mouse_x = app.winfo_pointerx()
-        mouse_y = app.winfo_pointery()
-        window_x = app.winfo_rootx()
-        window_y = app.winfo_rooty()
-        window_width = app.winfo_width()
-        window_height = app.winfo_height()
-        
-        return (window_x <= mouse_x <= window_x + window_width and 
-                window_y <= mouse_y <= window_y + window_height)
-    except Exception:
-        return False
+    return app._is_mouse_inside_window()
 
-def _should_update_ui(app, now: datetime, activity: Dict) -> bool:
+def _should_update_ui(app, now: datetime, activity: Dict, mouse_inside: bool) -> bool:
     """
     Determine if a full UI redraw is needed based on various conditions.
     
@@ -331,36 +356,21 @@ def _should_update_ui(app, now: datetime, activity: Dict) -> bool:
         app: The main TimeboxApp instance
         now: Current datetime for comparison
         activity: Current activity dictionary, or None if no active task
+        mouse_inside: Whether the mouse pointer is inside the window
         
     Returns:
         bool: True if full UI redraw should occur, False to skip redraw
     """
     # Always update on first run
-    if not hasattr(app, '_last_ui_update'):
-        log_debug("No previous _last_ui_update")
-        return True
-    
-    last_update = getattr(app, '_last_ui_update', None)
+    last_update = app._last_ui_update
     if last_update is None:
-        log_debug("The last_update is not set")
+        log_debug("No previous _last_ui_update")
         return True
     
     # Don't update if mouse pointer is inside window area - avoid interfering with user interaction
-    try:
-        mouse_x = app.winfo_pointerx()
-        mouse_y = app.winfo_pointery()
-        window_x = app.winfo_rootx()
-        window_y = app.winfo_rooty()
-        window_width = app.winfo_width()
-        window_height = app.winfo_height()
-        
-        if (window_x <= mouse_x <= window_x + window_width and 
-            window_y <= mouse_y <= window_y + window_height):
-            log_debug("Mouse pointer inside window area - skipping UI update")
-            return False
-    except Exception as e:
-        # If we can't get mouse position, continue with normal checks
-        log_debug(f"Could not check mouse position: {e}")
+    if mouse_inside:
+        log_debug("Mouse pointer inside window area - skipping UI update")
+        return False
     
     # Update if cards changed
     if getattr(app, 'card_visual_changed', False):
@@ -374,7 +384,7 @@ def _should_update_ui(app, now: datetime, activity: Dict) -> bool:
 
     # Redraw everything every 20 seconds
     seconds_since_last_action = (datetime.now() - app.last_action).total_seconds()
-    log_debug(f"Seconds since last action: {seconds_since_last_action}")
+    log_debug("Seconds since last action: %s", seconds_since_last_action)
 
     if seconds_since_last_action >= UIConstants.INACTIVITY_REDRAW_THRESHOLD_SEC:
         log_debug("Time since last acton above INACTIVE_REDRAW_THRESHOLD_SEC")
@@ -494,7 +504,7 @@ def _reset_timeline_to_top(app, now: datetime) -> None:
         if not getattr(app, 'disable_auto_centering', False):
             # Center view on current time
             minutes_since_start = (now.hour - app.start_hour) * 60 + now.minute
-            center_y = int(minutes_since_start * app.pixels_per_hour / 60) + 100
+            center_y = minutes_since_start * app.pixels_per_hour // 60 + 100
             new_offset = (app.winfo_height() // 2) - center_y
             delta_y = new_offset - app.offset_y
             app.offset_y = new_offset
@@ -523,7 +533,9 @@ def _reset_all_task_completion_status(app) -> None:
     """
     try:
         reset_count = 0
-        for card_obj in getattr(app, 'cards', []):
+        now = app.now_provider().time()
+        width = app.winfo_width()
+        for card_obj in app.cards:
             if hasattr(card_obj, '_tasks_done') and card_obj._tasks_done:
                 # Reset all tasks to undone
                 card_obj._tasks_done = [False] * len(card_obj._tasks_done)
@@ -533,7 +545,7 @@ def _reset_all_task_completion_status(app) -> None:
                 card_obj.update_card_visuals(
                     card_obj.start_hour, card_obj.start_minute,
                     app.start_hour, app.pixels_per_hour, app.offset_y,
-                    now=app.now_provider().time(), width=app.winfo_width()
+                    now=now, width=width
                 )
         
         log_debug(f"Reset {reset_count} task completion statuses for new day")
@@ -556,7 +568,8 @@ def _refresh_all_cards(app, now: datetime) -> None:
     """
     try:
         current_time = now.time()
-        for card_obj in getattr(app, 'cards', []):
+        width = app.winfo_width()
+        for card_obj in app.cards:
             # Refresh card visuals with current task states
             card_obj.update_card_visuals(
                 card_obj.start_hour,
@@ -565,7 +578,7 @@ def _refresh_all_cards(app, now: datetime) -> None:
                 app.pixels_per_hour,
                 app.offset_y,
                 now=current_time,
-                width=app.winfo_width()
+                width=width
             )
         
         log_debug(f"Refreshed {len(app.cards)} cards for new day")
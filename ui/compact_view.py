@@ -9,6 +9,9 @@ from datetime import datetime
 from utils.translator import t
 from utils.locale_utils import get_weekday_name
 
+# Default for CompactView.update(): look the current activity up in the schedule
+_LOOK_UP = object()
+
 
 class CompactView:
     """
@@ -223,8 +226,13 @@ class CompactView:
         self.window.update_idletasks()
         self.update()
     
-    def update(self):
-        """Update compact view with current information."""
+    def update(self, current_activity=_LOOK_UP):
+        """Update compact view with current information.
+        
+        Args:
+            current_activity: Activity the caller already looked up for this
+                tick (None if there is none), saves a second schedule scan
+        """
         if not self.is_visible or not self.window or not self.window.winfo_exists():
             return
         
@@ -240,7 +248,7 @@ class CompactView:
         self._update_time()
         
         # Update current activity
-        self._update_current_activity()
+        self._update_current_activity(current_activity)
         
         # Update next task
         self._update_next_task()
@@ -253,18 +261,18 @@ class CompactView:
         
         self.time_label.config(text=f"{weekday_name} {time_str}")
     
-    def _update_current_activity(self):
+    def _update_current_activity(self, current_activity=_LOOK_UP):
         """Update current activity information."""
-        # Get current activity from parent's schedule (same method as main app uses)
-        from utils.time_utils import get_current_activity
         from utils.logging import log_debug
         
-        now = self.now_provider()
-        log_debug(f"Compact view: Getting current activity for time {now}")
-        log_debug(f"Compact view: Schedule has {len(self.parent.schedule)} activities")
-        
-        current_activity = get_current_activity(self.parent.schedule, now)
-        log_debug(f"Compact view: Current activity = {current_activity}")
+        if current_activity is _LOOK_UP:
+            # Get current activity from parent's schedule (same method as main app uses)
+            from utils.time_utils import get_current_activity
+            now = self.now_provider()
+            log_debug("Compact view: Getting current activity for time %s", now)
+            log_debug("Compact view: Schedule has %d activities", len(self.parent.schedule))
+            current_activity = get_current_activity(self.parent.schedule, now)
+        log_debug("Compact view: Current activity = %s", current_activity)
         
         if current_activity:
             # Update activity name
@@ -284,7 +292,7 @@ class CompactView:
             
             # Update tasks info
             tasks = current_activity.get("tasks", [])
-            log_debug(f"Compact view: Activity has {len(tasks)} tasks")
+            log_debug("Compact view: Activity has %s tasks", len(tasks))
             
             if tasks and len(tasks) > 0:
                 # Get task completion status from parent app's cards
@@ -301,19 +309,19 @@ class CompactView:
                         tasks_done = getattr(card, '_tasks_done', [False] * total_tasks)
                         task_done_count = sum(tasks_done)
                         found_card = True
-                        log_debug(f"Compact view: Found card with {task_done_count}/{total_tasks} tasks done")
+                        log_debug("Compact view: Found card with %s/%s tasks done", task_done_count, total_tasks)
                         break
                 
                 if not found_card:
-                    log_debug(f"Compact view: No matching card found for activity")
+                    log_debug("Compact view: No matching card found for activity")
                 
                 # Update tasks label with "Tasks done x/y" format
                 self.tasks_label.config(
                     text=f"Tasks done {task_done_count}/{total_tasks}"
                 )
-                log_debug(f"Compact view: Tasks {task_done_count}/{total_tasks}")
+                log_debug("Compact view: Tasks %s/%s", task_done_count, total_tasks)
             else:
-                log_debug(f"Compact view: No tasks for this activity")
+                log_debug("Compact view: No tasks for this activity")
                 self.tasks_label.config(text="No tasks")
         else:
             # No current activity
@@ -276,7 +276,7 @@ def show_canvas_context_menu(app, event):
         def add_card():
             """Add a new card at the cursor position."""
             y_relative = event.y - 100 - app.offset_y
-            total_minutes = round_to_nearest_5_minutes(y_relative * 60 / app.pixels_per_hour)
+            total_minutes = round_to_nearest_5_minutes(round(y_relative * 60 / app.pixels_per_hour))
             start_hour = app.start_hour + total_minutes // 60
             start_minute = total_minutes % 60
             total_minutes += 25
@@ -297,7 +297,7 @@ def show_canvas_context_menu(app, event):
                 width=app.winfo_width(),
                 now_provider=app.now_provider
             )
-            new_card.draw(canvas=app.canvas, draw_end_time=True)
+            new_card.draw(canvas=app.canvas, now=app.now_provider().time(), draw_end_time=True)
             app.bind_mouse_actions(new_card)
             app.cards.append(new_card)
             app.schedule.append(new_card.to_dict())
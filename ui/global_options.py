@@ -280,11 +280,9 @@ def open_global_options(app):
                             return  # Stay in dialog to allow correction
                         # User clicked "No", proceed with the invalid URL
                     
-                    utils.notification.gotify_url = gotify_url
-                    utils.notification.gotify_token = gotify_token
+                    utils.notification.configure_gotify(gotify_url, gotify_token)
                 else:
-                    utils.notification.gotify_url = ""
-                    utils.notification.gotify_token = ""
+                    utils.notification.configure_gotify("", "")
                 
                 # Update advance notification settings
                 new_advance_enabled = advance_notification_enabled_var.get()
@@ -1,13 +1,106 @@
+from bisect import bisect_right
 from datetime import time
 import datetime
+from functools import lru_cache
+import itertools
+import time as time_module
 from tkinter import Canvas, font as tkfont
 import tkinter as tk
-from typing import Dict, List
+from typing import Dict, List, Optional
 from utils.logging import log_info, log_debug
 from utils.time_utils import TimeUtils
 from constants import UIConstants, Colors
 
+# "HH:MM" label for every minute of the day, indexed by hour * 60 + minute
+_HHMM = [f"{h:02d}:{m:02d}" for h in range(24) for m in range(60)]
+
+@lru_cache(maxsize=1024)
+def _card_geometry(start_mod: int, end_mod: int, width: Optional[int], pixels_per_hour: int, offset_y: int, start_of_workday: int):
+    """Compute (y, height, card_left, card_right) for a card.
+    
+    Cards sharing the same times and layout parameters reuse the cached result.
+    Width is part of the key, so a resize never returns stale values.
+    card_left/card_right are None when width is None.
+    """
+    start_hour, start_minute = divmod(start_mod, 60)
+    end_hour, end_minute = divmod(end_mod, 60)
+    # Position card relative to day start (start_of_workday is the day_start setting)
+    # If card hour is before day start, treat it as next day (add 24)
+    effective_start_hour = start_hour if start_hour >= start_of_workday else start_hour + 24
+    y = (effective_start_hour - start_of_workday) * pixels_per_hour + 100 + start_minute * pixels_per_hour // 60 + offset_y
+    
+    # Calculate height - handle cards that end past midnight
+    hour_diff = end_hour - start_hour
+    if hour_diff < 0:  # Card ends past midnight (e.g., 23:00 to 01:00)
+        hour_diff += 24
+    height = (hour_diff * pixels_per_hour) + int((end_minute - start_minute) * pixels_per_hour / 60)
+    if width is None:
+        return y, height, None, None
+    return y, height, int(width * UIConstants.CARD_LEFT_RATIO), int(width * UIConstants.CARD_RIGHT_RATIO)
+
+def _fit_text_to_width(font, text: str, max_width: int) -> str:
+    """Return text, or its longest prefix plus '...', that fits within max_width."""
+    # Check if text already fits
+    text_width = font.measure(text)
+    if text_width <= max_width:
+        return text
+    
+    # Binary search for the optimal truncation point
+    min_len = 0
+    max_len = len(text)
+    best_text = text
+    
+    while min_len <= max_len:
+        mid_len = (min_len + max_len) // 2
+        if mid_len <= 3:  # Need at least some characters for "..."
+            min_len = mid_len + 1
+            continue
+            
+        truncated = text[:mid_len] + "..."
+        truncated_width = font.measure(truncated)
+        
+        if truncated_width <= max_width:
+            best_text = truncated
+            min_len = mid_len + 1
+        else:
+            max_len = mid_len - 1
+    
+    return best_text
+
 class TaskCard:
+    # Fixed attribute set: no per-instance __dict__. The task tracking
+    # attributes (_tasks_done, _task_uuids, _tasks_done_callback) are attached
+    # by the app after loading and stay unset until then, so hasattr() checks
+    # on them keep working.
+    __slots__ = (
+        "activity", "now_provider", "task_tracking_service", "canvas",
+        "start_hour", "start_minute", "end_hour", "end_minute",
+        "_start_mod", "_end_mod", "_start_time", "_end_time",
+        "y", "height", "card_left", "card_right",
+        "card", "label", "progress", "progress_active",
+        "time_start_label", "time_end_label", "tasks_count_label",
+        "tag", "being_modified", "_item_options",
+        "_being_dragged", "_being_resized",
+        "_tasks_done", "_task_uuids", "_tasks_done_callback",
+        "_drawn_task_state",
+    )
+
+    # Bumped whenever any card is created, deleted or re-timed; lets
+    # CardTimeIndex detect that its sorted start times are stale.
+    timing_generation = 0
+    # Source of unique per-card canvas tags; unlike canvas item ids these are never reused
+    _tag_counter = itertools.count(1)
+    # Font used to measure card labels, created on first use (needs a Tk root)
+    _label_font = None
+    # Truncated label text by (text, max_width), see _truncate_text_to_width
+    _truncations: Dict = {}
+    _TRUNCATIONS_MAX_SIZE = 1024
+    # Fill color indexed by (is_finished << 1) | is_active, see _time_color
+    _TIME_COLORS = (Colors.INACTIVE_TASK, Colors.ACTIVE_TASK, Colors.FINISHED_TASK, Colors.FINISHED_TASK)
+    # Blinking task count colors for undone tasks, indexed by the parity of the current second
+    _PAST_UNDONE_BLINK = (Colors.TASK_COUNT_PAST_UNDONE, Colors.TASK_COUNT_TEXT)
+    _ACTIVE_UNDONE_BLINK = (Colors.TASK_COUNT_ACTIVE_UNDONE, Colors.TASK_COUNT_TEXT)
+
     def __init__(
             self,
             activity: Dict,
@@ -35,28 +128,44 @@ class TaskCard:
         
         self.start_hour, self.start_minute = start_time_obj.hour, start_time_obj.minute
         self.end_hour, self.end_minute = end_time_obj.hour, end_time_obj.minute
-        # Position card relative to day start (start_of_workday is the day_start setting)
-        # If card hour is before day start, treat it as next day (add 24)
-        effective_start_hour = self.start_hour if self.start_hour >= start_of_workday else self.start_hour + 24
-        self.y = (effective_start_hour - start_of_workday) * pixels_per_hour + 100 + int(self.start_minute * pixels_per_hour / 60) + offset_y
-        
-        # Calculate height - handle cards that end past midnight
-        hour_diff = self.end_hour - self.start_hour
-        if hour_diff < 0:  # Card ends past midnight (e.g., 23:00 to 01:00)
-            hour_diff += 24
-        self.height = (hour_diff * pixels_per_hour) + int((self.end_minute - self.start_minute) * pixels_per_hour / 60)
-        self.card_left = int(width * UIConstants.CARD_LEFT_RATIO)
-        self.card_right = int(width * UIConstants.CARD_RIGHT_RATIO)
+        self._start_mod = self._end_mod = None
+        self._refresh_minutes_of_day()
+        self.y, self.height, self.card_left, self.card_right = _card_geometry(
+            self._start_mod, self._end_mod, width, pixels_per_hour, offset_y, start_of_workday
+        )
         self.card = None
         self.label = None
-        self.now_provider = now_provider
-        self.time_label = None
-        self.canvas = None
+        # Progress bar item exists from draw() on and is only shown while the card is active
+        self.progress = None
+        self.progress_active = False
+        # Optional text items, created by draw() or later when they are needed
+        self.time_start_label = None
+        self.time_end_label = None
+        self.tasks_count_label = None
+        # Set by the drag/resize handlers while the card is being manipulated
+        self._being_dragged = False
+        self._being_resized = False
+        # _task_state() as of the last draw/update_card_visuals, see needs_time_refresh
+        self._drawn_task_state = None
+        # Shared by all canvas items of this card, used for mouse bindings
+        self.tag = f"card_{next(TaskCard._tag_counter)}"
         self.being_modified = False
+        # Last options sent to each canvas item, see _itemconfig
+        self._item_options: Dict[int, Dict] = {}
 
-        self.finished_color = Colors.FINISHED_TASK
-        self.active_color = Colors.ACTIVE_TASK
-        self.inactive_color = Colors.INACTIVE_TASK
+    def _refresh_minutes_of_day(self):
+        """Cache start/end as minutes since midnight and as time objects.
+
+        Must be called whenever start/end hour or minute fields change.
+        """
+        start_mod = self.start_hour * 60 + self.start_minute
+        end_mod = self.end_hour * 60 + self.end_minute
+        if start_mod != self._start_mod or end_mod != self._end_mod:
+            self._start_mod = start_mod
+            self._end_mod = end_mod
+            self._start_time = time(self.start_hour, self.start_minute)
+            self._end_time = time(self.end_hour, self.end_minute)
+            TaskCard.timing_generation += 1
 
     def _truncate_text_to_width(self, canvas: Canvas, text: str, max_width: int) -> str:
         """Truncate text to fit within max_width, adding '...' if truncated.
@@ -71,36 +180,20 @@ class TaskCard:
         """
         if not text:
             return text
-            
-        # Create a temporary font object for measurement
-        font = tkfont.Font(font=("Arial", 10))  # Default font size for labels
-        
-        # Check if text already fits
-        text_width = font.measure(text)
-        if text_width <= max_width:
-            return text
-        
-        # Binary search for the optimal truncation point
-        min_len = 0
-        max_len = len(text)
-        best_text = text
-        
-        while min_len <= max_len:
-            mid_len = (min_len + max_len) // 2
-            if mid_len <= 3:  # Need at least some characters for "..."
-                min_len = mid_len + 1
-                continue
-                
-            truncated = text[:mid_len] + "..."
-            truncated_width = font.measure(truncated)
-            
-            if truncated_width <= max_width:
-                best_text = truncated
-                min_len = mid_len + 1
-            else:
-                max_len = mid_len - 1
-        
-        return best_text
+        # Zoom and scroll refresh every card without changing its width, so
+        # the result is usually known and no font.measure() Tk call is needed
+        key = (text, max_width)
+        truncated = TaskCard._truncations.get(key)
+        if truncated is None:
+            # Font object for measurement is shared by all cards; creating one costs a Tk call
+            font = TaskCard._label_font
+            if font is None:
+                font = TaskCard._label_font = tkfont.Font(font=("Arial", 10))  # Default font size for labels
+            truncated = _fit_text_to_width(font, text, max_width)
+            if len(TaskCard._truncations) >= TaskCard._TRUNCATIONS_MAX_SIZE:
+                TaskCard._truncations.clear()
+            TaskCard._truncations[key] = truncated
+        return truncated
 
     # Make a clone function that will set the same properties as the original TaskCard
     def clone(self):
@@ -118,6 +211,7 @@ class TaskCard:
         clone.start_minute = self.start_minute
         clone.end_hour = self.end_hour
         clone.end_minute = self.end_minute
+        clone._refresh_minutes_of_day()
         clone.y = self.y
         clone.height = self.height
         clone.card_left = self.card_left
@@ -133,30 +227,42 @@ class TaskCard:
         """Set the being_modified flag to control visibility of progress bar."""
         self.being_modified = being_modified
 
+    def _itemconfig(self, item: int, **options):
+        """Configure a canvas item, skipping options that already have the requested value.
+        
+        Only options set through this method are tracked, so items must not be
+        reconfigured for the same options elsewhere.
+        """
+        last = self._item_options.setdefault(item, {})
+        changed = {key: value for key, value in options.items() if last.get(key) != value}
+        if changed:
+            self.canvas.itemconfig(item, **changed)
+            last.update(changed)
+
     def hide_progress_bar(self):
         """Hide the progress bar."""
-        if hasattr(self, 'progress') and self.progress:
-            self.canvas.itemconfig(self.progress, state="hidden")
+        if self.progress is not None:
+            self._itemconfig(self.progress, state="hidden")
 
     def show_progress_bar(self):
-        """Show the progress bar."""
-        if hasattr(self, 'progress') and self.progress:
-            self.canvas.itemconfig(self.progress, state="normal")
+        """Show the progress bar if the card is active."""
+        if self.progress is not None and self.progress_active:
+            self._itemconfig(self.progress, state="normal")
 
     def setup_card_progress_actions(self, canvas: Canvas):
         """Setup card progress actions."""
         log_debug("Binding card actions")
         # On card enter event, hide the progress rectangle
         def on_card_enter(event):
-            log_debug(f"Card {self.activity['name']} entered")
+            log_debug("Card %s entered", self.activity['name'])
             self.hide_progress_bar()
         # On card leave event, show the progress rectangle
         def on_card_leave(event):
-            log_debug(f"Card {self.activity['name']} left")
+            log_debug("Card %s left", self.activity['name'])
             self.show_progress_bar()
     
         canvas.tag_bind(self.card, "<Enter>", on_card_enter)
-        if hasattr(self, 'progress') and self.progress:
+        if self.progress is not None:
             canvas.tag_bind(self.progress, "<Enter>", on_card_enter)
         canvas.tag_bind(self.label, "<Enter>", on_card_enter)
         canvas.tag_bind(self.card, "<Leave>", on_card_leave)
@@ -169,72 +275,66 @@ class TaskCard:
         canvas.tag_unbind(self.label, "<Enter>")
         canvas.tag_unbind(self.card, "<Leave>")
         canvas.tag_unbind(self.label, "<Leave>")
-        if hasattr(self, 'progress') and self.progress:
+        if self.progress is not None:
             canvas.tag_unbind(self.progress, "<Enter>")
             canvas.tag_unbind(self.progress, "<Leave>")
 
-    def draw(self, canvas: Canvas, now: time = None, draw_end_time: bool = False):
-        """Draw the task card on the canvas."""
+    def draw(self, canvas: Canvas, now: time, draw_end_time: bool = False):
+        """Draw the task card on the canvas.
+        
+        Args:
+            now: Current time, sampled once per frame by the caller
+        """
         self.canvas = canvas
-        if now is None:
-            now = self.now_provider().time()
-        is_active = self.is_active_at(now)
-        is_finished = time(self.end_hour, self.end_minute) <= now
-        color = (
-            self.finished_color if is_finished else
-            self.active_color if is_active else
-            self.inactive_color
+        self._item_options = {}
+        # Start/end fields may have been set directly by callers (e.g. clone)
+        self._refresh_minutes_of_day()
+        now_mod = now.hour * 60 + now.minute
+        is_active = self._is_active_at_minute(now_mod)
+        color = self._time_color(now_mod)
+        # Tags and initial state are passed at creation time so that each item costs a single Tk call
+        # Card tag first: mouse handlers look the card up via gettags()[0]
+        tags = (self.tag, UIConstants.SCROLLABLE_TAG)
+        self.card = canvas.create_rectangle(self.card_left, self.y, self.card_right, self.y + self.height, fill=color, outline=Colors.CARD_OUTLINE, tags=tags)
+        self._item_options[self.card] = {"fill": color}
+        # Items are created bottom to top (card, progress, texts), so the stacking
+        # order is right from the start and never needs tag_raise later.
+        # Progress bar is created for every card and hidden unless the card is active
+        fill_right = self.card_left
+        if is_active:
+            elapsed_seconds, total_seconds = self._progress_seconds(now)
+            fill_right = self._progress_fill_right(elapsed_seconds, total_seconds)
+            percent = min(100, elapsed_seconds * 100 // total_seconds) if total_seconds > 0 else 100
+            log_info("Drawing progress for card %s: %d%%", self.activity['name'], percent)
+        progress_state = "normal" if is_active else "hidden"
+        self.progress = canvas.create_rectangle(
+            self.card_left, self.y, fill_right, self.y + self.height,
+            fill=Colors.CARD_PROGRESS_FILL, outline=Colors.CARD_PROGRESS_OUTLINE, state=progress_state,
+            tags=UIConstants.SCROLLABLE_TAG
         )
-        self.card = canvas.create_rectangle(self.card_left, self.y, self.card_right, self.y + self.height, fill=color, outline=Colors.CARD_OUTLINE)
-        # Progress bar for active card
+        self._item_options[self.progress] = {"state": progress_state}
+        self.progress_active = is_active
         # Calculate available width for text (with some padding)
         available_width = (self.card_right - self.card_left) - 20  # 10px padding on each side
         truncated_text = self._truncate_text_to_width(canvas, self.activity["name"], available_width)
-        self.label = canvas.create_text((self.card_left + self.card_right) // 2, self.y + self.height // 2, text=truncated_text)
+        self.label = canvas.create_text((self.card_left + self.card_right) // 2, self.y + self.height // 2, text=truncated_text, tags=tags)
+        self._item_options[self.label] = {"text": truncated_text}
         if is_active:
-            # Calculate total_seconds - handle cards that end past midnight
-            hour_diff_for_progress = self.end_hour - self.start_hour
-            if hour_diff_for_progress < 0:
-                hour_diff_for_progress += 24
-            total_seconds = hour_diff_for_progress * 3600 + (self.end_minute - self.start_minute) * 60
-            # Calculate elapsed_seconds - handle cards that span midnight
-            current_hour = now.hour
-            if current_hour < self.start_hour:  # We've crossed midnight
-                current_hour += 24
-            elapsed_seconds = (current_hour - self.start_hour) * 3600 + (now.minute - self.start_minute) * 60 + now.second
-            progress = min(elapsed_seconds / total_seconds, 1) if total_seconds > 0 else 1
-            log_info(f"Drawing progress for card {self.activity['name']}: {progress:.2f}")
-            fill_right = self.card_left + int((self.card_right - self.card_left) * progress)
-            self.progress = canvas.create_rectangle(self.card_left, self.y, fill_right, self.y + self.height, fill=Colors.CARD_PROGRESS_FILL, outline=Colors.CARD_PROGRESS_OUTLINE)
             self.setup_card_progress_actions(canvas)
-            canvas.tag_raise(self.label)
-        tag = f"card_{self.card}"
-        canvas.itemconfig(self.card, tags=(tag))
-        canvas.itemconfig(self.label, tags=(tag))
 
-        self.time_start_label = canvas.create_text(
-            self.card_left - 10, self.y, text=f"{self.start_hour:02d}:{self.start_minute:02d}", font=("Arial", 8), anchor="e"
-        )
-        canvas.itemconfig(self.time_start_label, tags=(tag))
+        # Time labels are only created once they have to be shown; most of them
+        # stay hidden (full hours, adjacent cards), so this keeps the item count down
+        self.time_start_label = None
+        self.time_end_label = None
         # Hide time_start_label if at 0 minutes
-        if self.start_minute == 0:
-            canvas.itemconfig(self.time_start_label, state="hidden")
-        
-        end_time_text = f"{self.end_hour:02d}:{self.end_minute:02d}"
-        self.time_end_label = canvas.create_text(
-            self.card_left - 10, self.y + self.height, text=end_time_text, font=("Arial", 8), anchor="e"
-        )
-        canvas.itemconfig(self.time_end_label, tags=(tag))
+        self._sync_time_label('time_start_label', self.y, _HHMM[self._start_mod], self.start_minute != 0)
         # Hide time_end_label if draw_end_time is False (next card starts at same time)
         # or if at 0 minutes and we're allowed to draw it
-        if not draw_end_time or (draw_end_time and self.end_minute == 0):
-            canvas.itemconfig(self.time_end_label, state="hidden")
+        self._sync_time_label('time_end_label', self.y + self.height, _HHMM[self._end_mod], draw_end_time and self.end_minute != 0)
         # Add tasks count label if tasks exist
         tasks = self.activity.get("tasks", [])
         if tasks:  # Show tasks label if any tasks exist
-            # Use _tasks_done if present, otherwise count all as not done
-            tasks_done = getattr(self, '_tasks_done', [False] * len(tasks))
-            done_count = sum(tasks_done)
+            done_count = self.done_task_count()
             total_count = len(tasks)
             
             # Generate text with streak information
@@ -244,13 +344,60 @@ class TaskCard:
             self.tasks_count_label = canvas.create_text(
                 self.card_right - 5, self.y + self.height - 5,
                 text=tasks_text,
-                font=("Arial", 8, "bold"), anchor="se", fill=color
+                font=("Arial", 8, "bold"), anchor="se", fill=color, tags=tags
             )
-            canvas.itemconfig(self.tasks_count_label, tags=(tag))
+            self._item_options[self.tasks_count_label] = {"text": tasks_text, "state": "normal", "fill": color}
         else:
             self.tasks_count_label = None
+        self._drawn_task_state = self._task_state()
         return self
 
+    def _progress_seconds(self, now: time):
+        """Return (elapsed_seconds, total_seconds) of the card at the given time."""
+        # Calculate total_seconds - handle cards that end past midnight
+        hour_diff = self.end_hour - self.start_hour
+        if hour_diff < 0:
+            hour_diff += 24
+        total_seconds = hour_diff * 3600 + (self.end_minute - self.start_minute) * 60
+        # Calculate elapsed_seconds - handle cards that span midnight
+        current_hour = now.hour
+        if current_hour < self.start_hour:  # We've crossed midnight
+            current_hour += 24
+        elapsed_seconds = (current_hour - self.start_hour) * 3600 + (now.minute - self.start_minute) * 60 + now.second
+        return elapsed_seconds, total_seconds
+
+    def _progress_fill_right(self, elapsed_seconds: int, total_seconds: int) -> int:
+        """Return the x coordinate where the progress bar ends, using integer math only."""
+        if total_seconds <= 0:
+            return self.card_right
+        span = self.card_right - self.card_left
+        return self.card_left + min(span, span * elapsed_seconds // total_seconds)
+
+    def _sync_time_label(self, attr_name: str, y: int, text: str, visible: bool):
+        """Create, update or hide the time label stored in attr_name.
+        
+        The label item is created on first use only; once it exists it is
+        kept and toggled via its state.
+        """
+        item = getattr(self, attr_name)
+        if item is None:
+            if not visible:
+                return
+            item = self.canvas.create_text(
+                self.card_left - 10, y, text=text, font=("Arial", 8), anchor="e",
+                tags=(self.tag, UIConstants.SCROLLABLE_TAG)
+            )
+            setattr(self, attr_name, item)
+            self._item_options[item] = {"text": text, "state": "normal"}
+            return
+        self.canvas.coords(item, self.card_left - 10, y)
+        self._itemconfig(item, text=text, state="normal" if visible else "hidden")
+
+    def done_task_count(self) -> int:
+        """Return how many tasks are marked done; without tracking data none are."""
+        tasks_done = getattr(self, '_tasks_done', None)
+        return sum(tasks_done) if tasks_done else 0
+
     def _generate_tasks_text(self) -> str:
         """Generate the tasks display text with streak information.
         
@@ -261,8 +408,7 @@ class TaskCard:
         if not tasks:
             return ""
         
-        tasks_done = getattr(self, '_tasks_done', [False] * len(tasks))
-        done_count = sum(tasks_done)
+        done_count = self.done_task_count()
         total_count = len(tasks)
         
         # Calculate streak information if task_tracking_service is available
@@ -281,46 +427,29 @@ class TaskCard:
         
         return f"Tasks: {done_count}/{total_count}{streak_info}"
     
-    def _get_task_count_color(self, done_count: int, total_count: int, now: time = None) -> str:
-        """Get the color for task count display based on completion status and card's time status."""
+    def _get_task_count_color(self, done_count: int, total_count: int, now: time) -> str:
+        """Get the color for task count display based on completion status and card's time status.
+
+        now is the frame's time snapshot passed down from draw/update_card_visuals.
+        """
         # Check if card is being dragged or resized (disable special coloring)
-        if getattr(self, '_being_dragged', False) or getattr(self, '_being_resized', False):
+        if self._being_dragged or self._being_resized:
             return Colors.TASK_COUNT_TEXT  # Default black color
         
-        # Get current time
-        if now is None:
-            now = self.now_provider().time() if self.now_provider else time(0, 0)
-        
         # Determine card status relative to current time
-        start_time = time(self.start_hour, self.start_minute)
-        end_time = time(self.end_hour, self.end_minute)
+        now_mod = now.hour * 60 + now.minute
         
         # All tasks done - green
         if done_count == total_count:
             return Colors.TASK_COUNT_ALL_DONE  # Dark green
         
-        # Some tasks undone
-        undone_count = total_count - done_count
+        # Finished card (past) with undone tasks - blinking red/black every second
+        if self._end_mod <= now_mod:
+            return TaskCard._PAST_UNDONE_BLINK[int(time_module.time()) % 2]
         
-        # Finished card (past) with undone tasks - blinking red/black
-        if end_time <= now:
-            import time as time_module
-            current_second = int(time_module.time())
-            # Alternate between red and black every second for blinking effect
-            if current_second % 2 == 0:
-                return Colors.TASK_COUNT_PAST_UNDONE  # Red
-            else:
-                return Colors.TASK_COUNT_TEXT  # Black (for blinking effect)
-        
-        # Active card (current) with undone tasks - blinking
-        elif start_time <= now < end_time:
-            import time as time_module
-            current_second = int(time_module.time())
-            # Alternate between red and black every second for blinking effect
-            if current_second % 2 == 0:
-                return Colors.TASK_COUNT_ACTIVE_UNDONE  # Red
-            else:
-                return Colors.TASK_COUNT_TEXT  # Black (for blinking effect)
+        # Active card (current) with undone tasks - blinking red/black every second
+        elif self._start_mod <= now_mod < self._end_mod:
+            return TaskCard._ACTIVE_UNDONE_BLINK[int(time_module.time()) % 2]
         
         # Future card with undone tasks - default black
         else:
@@ -332,10 +461,10 @@ class TaskCard:
         canvas_objects = [
             ('card', self.card),
             ('label', self.label),
-            ('progress', getattr(self, 'progress', None)),
-            ('time_start_label', getattr(self, 'time_start_label', None)),
-            ('time_end_label', getattr(self, 'time_end_label', None)),
-            ('tasks_count_label', getattr(self, 'tasks_count_label', None))
+            ('progress', self.progress),
+            ('time_start_label', self.time_start_label),
+            ('time_end_label', self.time_end_label),
+            ('tasks_count_label', self.tasks_count_label)
         ]
         
         # Clean up all canvas objects
@@ -350,137 +479,148 @@ class TaskCard:
         
         # Clear canvas reference to prevent memory leaks
         self.canvas = None
+        self._item_options = {}
+        TaskCard.timing_generation += 1
 
     def get_time_range(self):
         """Get the time range of the card."""
-        return time(self.start_hour, self.start_minute), time(self.end_hour, self.end_minute)
+        return self._start_time, self._end_time
     
     def is_active_at(self, current_time: time) -> bool:
         """Check if this card is active at the given time."""
-        start_time = time(self.start_hour, self.start_minute)
-        end_time = time(self.end_hour, self.end_minute)
+        return self._is_active_at_minute(current_time.hour * 60 + current_time.minute)
+
+    def _is_active_at_minute(self, now_mod: int) -> bool:
+        """Check if this card is active at the given minute of day.
         
+        Card boundaries have no seconds, so minute granularity gives the same
+        result as comparing full time objects.
+        """
         # Handle cards that span past midnight (e.g., 23:30 to 01:30)
-        if end_time < start_time:  # Card crosses midnight
-            # Current time is active if it's either >= start_time OR < end_time
-            return current_time >= start_time or current_time < end_time
+        if self._end_mod < self._start_mod:  # Card crosses midnight
+            # Current time is active if it's either >= start OR < end
+            return now_mod >= self._start_mod or now_mod < self._end_mod
         else:
-            return start_time <= current_time < end_time
+            return self._start_mod <= now_mod < self._end_mod
+
+    def _time_color(self, now_mod: int) -> str:
+        """Card fill color for the given minute of day when the card is not being manipulated."""
+        return TaskCard._TIME_COLORS[(self._end_mod <= now_mod) << 1 | self._is_active_at_minute(now_mod)]
+
+    def _task_state(self):
+        """Everything the tasks count label is drawn from besides the time."""
+        return (
+            len(self.activity.get("tasks", [])),
+            tuple(getattr(self, '_tasks_done', None) or ()),
+            tuple(getattr(self, '_task_uuids', None) or ()),
+        )
 
-    def update_card_visuals(self, new_start_hour, new_start_minute, start_of_workday, pixels_per_hour, offset_y, now=None, show_start_time=True, show_end_time=True, width=None, is_moving=False):
+    def needs_time_refresh(self, now_mod: int) -> bool:
+        """Check whether visuals (progress bar, fill color, tasks label) may be outdated.
+        
+        True for the active card, for a card still showing its progress bar and
+        for any card whose last drawn color no longer matches the time, e.g.
+        after the computer was suspended for a while. Also true when the task
+        done states changed since the last draw (compact view, task tracking
+        reload, day rollover) and for a past card whose undone tasks blink.
+        """
+        if self.progress_active or self._is_active_at_minute(now_mod):
+            return True
+        if self._item_options.get(self.card, {}).get("fill") != self._time_color(now_mod):
+            return True
+        task_state = self._task_state()
+        if task_state != self._drawn_task_state:
+            return True
+        task_count = task_state[0]
+        return task_count > 0 and self._end_mod <= now_mod and self.done_task_count() < task_count
+
+    def update_card_visuals(self, new_start_hour, new_start_minute, start_of_workday, pixels_per_hour, offset_y, now, show_start_time=True, show_end_time=True, width=None, is_moving=False):
         """Move/resize the card, update progress bar, and update label positions/visibility. Also update width if provided.
         
         Args:
             start_of_workday: Hour when the day starts for card management (day_start setting)
+            now: Current time, sampled once per frame by the caller
         """
-        if now is None:
-            now = self.now_provider().time() if self.now_provider else time(0, 0)
-        if width is not None:
-            self.card_left = int(width * 0.15)
-            self.card_right = int(width * 0.85)
-        # Calculate new end time - handle cards that end past midnight
-        hour_diff = self.end_hour - self.start_hour
-        if hour_diff < 0:  # Card ends past midnight
-            hour_diff += 24
-        card_duration_minutes = hour_diff * 60 + (self.end_minute - self.start_minute)
-        #log_debug(f"Cards duration in minutes: {card_duration_minutes}")
-        total_minutes = new_start_hour * 60 + new_start_minute + card_duration_minutes
-        total_minutes = total_minutes % (24 * 60)
-        self.end_hour = total_minutes // 60
-        self.end_minute = total_minutes % 60
-        self.start_hour = new_start_hour
-        self.start_minute = new_start_minute % 60
-        # Position card relative to day start (start_of_workday is the day_start setting)
-        # If card hour is before day start, treat it as next day (add 24)
-        effective_start_hour = self.start_hour if self.start_hour >= start_of_workday else self.start_hour + 24
-        self.y = (effective_start_hour - start_of_workday) * pixels_per_hour + 100 + int(self.start_minute * pixels_per_hour / 60) + offset_y
-        
-        # Calculate height - handle cards that end past midnight
-        hour_diff = self.end_hour - self.start_hour
-        if hour_diff < 0:  # Card ends past midnight (e.g., 23:00 to 01:00)
-            hour_diff += 24
-        height = (hour_diff * pixels_per_hour) + int((self.end_minute - self.start_minute) * pixels_per_hour / 60)
+        # Resize, zoom and refresh pass the card's own start; only a move changes the times
+        if new_start_hour != self.start_hour or new_start_minute != self.start_minute:
+            # Calculate new end time - handle cards that end past midnight
+            hour_diff = self.end_hour - self.start_hour
+            if hour_diff < 0:  # Card ends past midnight
+                hour_diff += 24
+            card_duration_minutes = hour_diff * 60 + (self.end_minute - self.start_minute)
+            total_minutes = new_start_hour * 60 + new_start_minute + card_duration_minutes
+            total_minutes = total_minutes % (24 * 60)
+            self.end_hour = total_minutes // 60
+            self.end_minute = total_minutes % 60
+            self.start_hour = new_start_hour
+            self.start_minute = new_start_minute % 60
+        # Start/end fields may also have been changed directly (e.g. resize by dragging)
+        self._refresh_minutes_of_day()
+        now_mod = now.hour * 60 + now.minute
+        self.y, height, card_left, card_right = _card_geometry(
+            self._start_mod, self._end_mod, width, pixels_per_hour, offset_y, start_of_workday
+        )
         self.height = height
+        if width is not None:
+            self.card_left = card_left
+            self.card_right = card_right
         # Move/resize card
         self.canvas.coords(self.card, self.card_left, self.y, self.card_right, self.y + height)
-        # Update progress bar - always move it with the card even when hidden
+        # Update progress bar - only moved while shown, positioned again when it reappears
         # Don't show progress if card is being dragged or resized
-        is_being_manipulated = getattr(self, '_being_dragged', False) or getattr(self, '_being_resized', False)
-        should_show_progress = not is_moving and not is_being_manipulated and self.is_active_at(now)
+        is_being_manipulated = self._being_dragged or self._being_resized
+        should_show_progress = not is_moving and not is_being_manipulated and self._is_active_at_minute(now_mod)
         if should_show_progress:
-            # Calculate total_seconds - handle cards that end past midnight
-            hour_diff_for_progress = self.end_hour - self.start_hour
-            if hour_diff_for_progress < 0:
-                hour_diff_for_progress += 24
-            total_seconds = hour_diff_for_progress * 3600 + (self.end_minute - self.start_minute) * 60
-            # Calculate elapsed_seconds - handle cards that span midnight
-            current_hour = now.hour
-            if current_hour < self.start_hour:  # We've crossed midnight
-                current_hour += 24
-            elapsed_seconds = (current_hour - self.start_hour) * 3600 + (now.minute - self.start_minute) * 60 + now.second
-            progress = min(elapsed_seconds / total_seconds, 1) if total_seconds > 0 else 1
-            fill_right = self.card_left + int((self.card_right - self.card_left) * progress)
-            if not hasattr(self, 'progress') or self.progress is None:
-                self.progress = self.canvas.create_rectangle(self.card_left, self.y, fill_right, self.y + self.height, fill=Colors.CARD_PROGRESS_FILL_NO_OUTLINE, outline="")
+            fill_right = self._progress_fill_right(*self._progress_seconds(now))
+            self.canvas.coords(self.progress, self.card_left, self.y, fill_right, self.y + self.height)
+            if not self.progress_active:
+                self.progress_active = True
                 self.setup_card_progress_actions(self.canvas)
-            else:
-                self.canvas.coords(self.progress, self.card_left, self.y, fill_right, self.y + self.height)
-                self.show_progress_bar()
-            self.canvas.itemconfig(self.progress, state="normal")
-            self.canvas.itemconfig(self.card, fill=self.active_color)
-            self.canvas.tag_raise(self.label)
+            self.show_progress_bar()
+            self._itemconfig(self.card, fill=Colors.ACTIVE_TASK)
         else:
-            if hasattr(self, 'progress') and self.progress is not None:
-                self.canvas.delete(self.progress)
-                self.progress = None
-            color = self.finished_color if time(self.end_hour, self.end_minute) <= now else self.inactive_color
-            self.canvas.itemconfig(self.card, fill=color)
+            if self.progress_active:
+                self.progress_active = False
+                self.hide_progress_bar()
+            # Active cards without progress (being moved) use the inactive color
+            color = TaskCard._TIME_COLORS[(self._end_mod <= now_mod) << 1]
+            self._itemconfig(self.card, fill=color)
 
         # Update text labels
-        self.canvas.itemconfig(self.time_start_label, text=f"{self.start_hour:02d}:{self.start_minute:02d}")
-        self.canvas.coords(self.time_start_label, self.card_left - 10, self.y)
-        self.canvas.itemconfig(self.time_start_label, state="hidden" if self.start_minute == 0 or not show_start_time else "normal")
-
-        self.canvas.itemconfig(self.time_end_label, text=f"{self.end_hour:02d}:{self.end_minute:02d}")
-        self.canvas.coords(self.time_end_label, self.card_left - 10, self.y + self.height)
-        self.canvas.itemconfig(self.time_end_label, state="hidden" if not show_end_time or (show_end_time and self.end_minute == 0) else "normal")
+        self._sync_time_label('time_start_label', self.y, _HHMM[self._start_mod], show_start_time and self.start_minute != 0)
+        self._sync_time_label('time_end_label', self.y + self.height, _HHMM[self._end_mod], show_end_time and self.end_minute != 0)
 
         self.canvas.coords(self.label, (self.card_left + self.card_right) // 2, self.y + self.height // 2)
         # Calculate available width for text (with some padding)
         available_width = (self.card_right - self.card_left) - 20  # 10px padding on each side
         truncated_text = self._truncate_text_to_width(self.canvas, self.activity["name"], available_width)
-        self.canvas.itemconfig(self.label, text=truncated_text)
+        self._itemconfig(self.label, text=truncated_text)
 
         # Update or create tasks count label
         tasks = self.activity.get("tasks", [])
         if tasks:  # Show tasks label if any tasks exist
-            tasks_done = getattr(self, '_tasks_done', [False] * len(tasks))
-            done_count = sum(tasks_done)
+            done_count = self.done_task_count()
             total_count = len(tasks)
             # Generate text with streak information
             tasks_text = self._generate_tasks_text()
+            # Set color based on completion status and card's time status
+            color = self._get_task_count_color(done_count, total_count, now)
             
-            if not hasattr(self, 'tasks_count_label') or self.tasks_count_label is None:
+            if self.tasks_count_label is None:
                 self.tasks_count_label = self.canvas.create_text(
                     self.card_right - 5, self.y + self.height - 5,
                     text=tasks_text,
-                    font=("Arial", 8, "bold"), anchor="se", fill=Colors.TASK_COUNT_TEXT
+                    font=("Arial", 8, "bold"), anchor="se", fill=color, tags=(self.tag, UIConstants.SCROLLABLE_TAG)
                 )
-                tag = f"card_{self.card}"
-                self.canvas.itemconfig(self.tasks_count_label, tags=(tag))
+                self._item_options[self.tasks_count_label] = {"text": tasks_text, "state": "normal", "fill": color}
             else:
                 self.canvas.coords(self.tasks_count_label, self.card_right - 5, self.y + self.height - 5)
-                self.canvas.itemconfig(self.tasks_count_label, text=tasks_text, state="normal")
-            # Raise task count and label above other elements (i.e. progress bar)
-            self.canvas.tag_raise(self.tasks_count_label)
-            self.canvas.tag_raise(self.label)
-
-            # Set color based on completion status and card's time status
-            color = self._get_task_count_color(done_count, total_count, now)
-            self.canvas.itemconfig(self.tasks_count_label, fill=color)
+                # Text, visibility and color go out in a single itemconfig call
+                self._itemconfig(self.tasks_count_label, text=tasks_text, state="normal", fill=color)
         else:
-            if hasattr(self, 'tasks_count_label') and self.tasks_count_label is not None:
-                self.canvas.itemconfig(self.tasks_count_label, state="hidden")
+            if self.tasks_count_label is not None:
+                self._itemconfig(self.tasks_count_label, state="hidden")
+        self._drawn_task_state = self._task_state()
 
         self.being_modified = False  # Reset being_modified flag after updating visuals
 
@@ -500,6 +640,41 @@ class TaskCard:
             result["tasks"] = self.activity["tasks"]
         return result
 
+class CardTimeIndex:
+    """Cards sorted by start minute for O(log N) active card lookup.
+    
+    The index is rebuilt lazily whenever TaskCard.timing_generation changes,
+    so card edits (drag, resize, add, remove) never leave it stale.
+    Overlapping cards are allowed (edits only warn about conflicts); then the
+    lookup returns the latest started active card, so callers after a specific
+    activity must check the hit and fall back to a scan.
+    """
+
+    def __init__(self):
+        self._generation = None
+        self._cards: List[TaskCard] = []
+        self._starts: List[int] = []
+
+    def _rebuild(self, cards: List[TaskCard]):
+        self._cards = sorted(cards, key=lambda card: card._start_mod)
+        self._starts = [card._start_mod for card in self._cards]
+        self._generation = TaskCard.timing_generation
+
+    def find_active(self, cards: List[TaskCard], now_mod: int) -> Optional[TaskCard]:
+        """Return the card active at the given minute of day, or None."""
+        if self._generation != TaskCard.timing_generation or len(cards) != len(self._cards):
+            self._rebuild(cards)
+        if not self._cards:
+            return None
+        idx = bisect_right(self._starts, now_mod) - 1
+        if idx >= 0 and self._cards[idx]._is_active_at_minute(now_mod):
+            return self._cards[idx]
+        # Before the first start of the day only a card crossing midnight can be active
+        last = self._cards[-1]
+        if last._is_active_at_minute(now_mod):
+            return last
+        return None
+
 def create_task_cards(
     canvas: Canvas,
     schedule: List[Dict],
@@ -511,28 +686,16 @@ def create_task_cards(
     task_tracking_service=None
 ) -> List[TaskCard]:
     """Create task card objects and draw them on the canvas."""
-    cards = []
     now = now_provider().time()
-    active_y = None
-    count = len(schedule)
-    for index, activity in enumerate(schedule):
-        card_obj = TaskCard(activity, start_of_workday, pixels_per_hour, offset_y, width, 
-                          now_provider=now_provider, task_tracking_service=task_tracking_service)
-        draw_end_time = False
-        # Draw end time if there is a gap between this and the next card
-        if index < count - 1:
-            next_activity = schedule[index + 1]
-            next_start_time = TimeUtils.parse_time_with_validation(next_activity["start_time"])
-            next_start_hour, next_start_minute = next_start_time.hour, next_start_time.minute
-            if (next_start_hour, next_start_minute) != (card_obj.end_hour, card_obj.end_minute):
-                draw_end_time = True
-        else:
-            draw_end_time = True
+    cards = [
+        TaskCard(activity, start_of_workday, pixels_per_hour, offset_y, width,
+                 now_provider=now_provider, task_tracking_service=task_tracking_service)
+        for activity in schedule
+    ]
+    count = len(cards)
+    for index, card_obj in enumerate(cards):
+        # Draw end time if there is a gap between this and the next card;
+        # the next card has already parsed its start time
+        draw_end_time = index == count - 1 or cards[index + 1]._start_mod != card_obj._end_mod
         card_obj.draw(canvas, now, draw_end_time=draw_end_time)
-        # Find active card's y for green arrows
-        start_time, end_time = card_obj.get_time_range()
-        if start_time <= now < end_time:
-            minutes_since_start = (now.hour*60+now.minute) - (card_obj.start_hour*60+card_obj.start_minute)
-            active_y = card_obj.y + int(minutes_since_start * pixels_per_hour / 60)
-        cards.append(card_obj)
     return cards
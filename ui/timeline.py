@@ -1,6 +1,47 @@
 from tkinter import Canvas
 from datetime import time
-from constants import Colors
+from constants import Colors, UIConstants
+
+TIMELINE_TOTAL_MINUTES = 24 * 60
+# Timeline items also move with the cards when scrolling
+TIMELINE_TAGS = ("timeline", UIConstants.SCROLLABLE_TAG)
+HOUR_TEXT_X = 5
+MINUTE_TEXT_X = 36
+
+def _format_current_time(current_time, with_seconds: bool) -> str:
+    """Format current time as HH:MM:SS or HH:MM without going through strftime."""
+    if with_seconds:
+        return f"{current_time.hour:02d}:{current_time.minute:02d}:{current_time.second:02d}"
+    return f"{current_time.hour:02d}:{current_time.minute:02d}"
+
+def _timeline_ys(pixels_per_hour: int, offset_y: int, granularity: int):
+    """Return the y coordinate of every timeline step, computed in one pass.
+
+    Integer math keeps grid lines on the same pixels as the card edges.
+    """
+    base_y = 100 + offset_y
+    return [minute * pixels_per_hour // 60 + base_y for minute in range(0, TIMELINE_TOTAL_MINUTES + 1, granularity)]
+
+def _grid_line_coords(ys, width: int):
+    """Flat coords of one polyline drawing a horizontal grid line at each y.
+    
+    The line zigzags between consecutive rows; the connecting vertical
+    segments lie just outside the canvas (x < 0 and x > width), so only the
+    horizontal lines are visible. This replaces one canvas item per line.
+    """
+    left, right = -10, width + 10
+    coords = []
+    for index, y in enumerate(ys):
+        if index % 2:
+            coords.extend((right, y, left, y))
+        else:
+            coords.extend((left, y, right, y))
+    return coords
+
+def _split_grid_ys(ys, granularity: int):
+    """Split timeline step ys into (hour line ys, minute line ys)."""
+    steps_per_hour = 60 // granularity
+    return ys[::steps_per_hour], [y for index, y in enumerate(ys) if index % steps_per_hour]
 
 def draw_current_time_line(canvas: Canvas, width: int, start_hour: int, pixels_per_hour: int, offset_y: int, current_time, mouse_inside_window: bool):
     """Draw current time line and text on the timeline.
@@ -12,19 +53,17 @@ def draw_current_time_line(canvas: Canvas, width: int, start_hour: int, pixels_p
         return []
     
     # Calculate position based on current time relative to day start
-    current_minutes = current_time.hour * 60 + current_time.minute + current_time.second / 60.0
-    day_start_minutes = start_hour * 60
-    y = ((current_minutes - day_start_minutes) / 60) * pixels_per_hour + 100 + offset_y
+    seconds_since_start = (current_time.hour - start_hour) * 3600 + current_time.minute * 60 + current_time.second
+    y = seconds_since_start * pixels_per_hour // 3600 + 100 + offset_y
     
     # Create green dotted line with same style as hour lines
-    line = canvas.create_line(0, y, width, y, fill=Colors.TIMELINE_CURRENT_TIME_LINE, dash=(2, 2), tags="timeline")
+    line = canvas.create_line(0, y, width, y, fill=Colors.TIMELINE_CURRENT_TIME_LINE, dash=(2, 2), tags=TIMELINE_TAGS)
     
     # Create time text with format based on mouse position
-    time_format = "%H:%M:%S" if mouse_inside_window else "%H:%M"
-    time_text = current_time.strftime(time_format)
+    time_text = _format_current_time(current_time, mouse_inside_window)
     # Position text on the right side with some padding from the edge
     text_x = width - 5
-    text = canvas.create_text(text_x, y, anchor="ne", text=time_text, fill=Colors.TIMELINE_CURRENT_TIME_TEXT, font=("Arial", 9, "bold"), tags="timeline")
+    text = canvas.create_text(text_x, y, anchor="ne", text=time_text, fill=Colors.TIMELINE_CURRENT_TIME_TEXT, font=("Arial", 9, "bold"), tags=TIMELINE_TAGS)
     
     return [line, text]
 
@@ -34,38 +73,48 @@ def draw_timeline(canvas: Canvas, width: int, start_hour: int, pixels_per_hour:
     Args:
         start_hour: Hour when the day starts for card management (day_start setting)
     """
-    total_minutes = 24 * 60
     created_objects = []
-    for minute in range(0, total_minutes + 1, granularity):
+    ys = _timeline_ys(pixels_per_hour, offset_y, granularity)
+    # All hour lines form one canvas item and all minute lines another;
+    # they are created before the texts so the texts stay on top
+    hour_ys, minute_ys = _split_grid_ys(ys, granularity)
+    created_objects.append(canvas.create_line(
+        *_grid_line_coords(hour_ys, width), fill=Colors.TIMELINE_HOUR_LINE, dash=(2, 2), tags=TIMELINE_TAGS
+    ))
+    if minute_ys:
+        created_objects.append(canvas.create_line(
+            *_grid_line_coords(minute_ys, width), fill=Colors.TIMELINE_MINUTE_LINE, dash=(1, 4), tags=TIMELINE_TAGS
+        ))
+    # One text per step
+    for minute, y in zip(range(0, TIMELINE_TOTAL_MINUTES + 1, granularity), ys):
         hour = (start_hour + minute // 60) % 24
         min_in_hour = minute % 60
-        y = (minute / 60) * pixels_per_hour + 100 + offset_y
-        color = Colors.TIMELINE_HOUR_LINE if min_in_hour == 0 else Colors.TIMELINE_MINUTE_LINE
-        dash = (2, 2) if min_in_hour == 0 else (1, 4)
-        line = canvas.create_line(0, y, width, y, fill=color, dash=dash, tags="timeline")
-        created_objects.append(line)
         if min_in_hour == 0:
-            text = canvas.create_text(5, y, anchor="nw", text=f"{hour}:00", fill=Colors.TIMELINE_TEXT, tags="timeline")
+            text = canvas.create_text(HOUR_TEXT_X, y, anchor="nw", text=f"{hour}:00", fill=Colors.TIMELINE_TEXT, tags=TIMELINE_TAGS)
             created_objects.append(text)
         elif granularity < 60:
-            text = canvas.create_text(36, y, anchor="nw", text=f"{hour:02d}:{min_in_hour:02d}", fill=Colors.TIMELINE_MINUTE_TEXT, font=("Arial", 7), tags="timeline")
+            text = canvas.create_text(MINUTE_TEXT_X, y, anchor="nw", text=f"{hour:02d}:{min_in_hour:02d}", fill=Colors.TIMELINE_MINUTE_TEXT, font=("Arial", 7), tags=TIMELINE_TAGS)
             created_objects.append(text)
 
     return created_objects
 
-def reposition_current_time_line(canvas: Canvas, current_time_objects, start_hour: int, pixels_per_hour: int, offset_y: int, width: int, current_time, mouse_inside_window: bool):
+def reposition_current_time_line(canvas: Canvas, current_time_objects, start_hour: int, pixels_per_hour: int, offset_y: int, width: int, current_time, mouse_inside_window: bool, shown_text=None):
     """Reposition current time line and update text format based on mouse position.
     
     Args:
         start_hour: Hour when the day starts for card management (day_start setting)
+        shown_text: Text the time item currently shows, as returned by the previous
+            call; None if unknown
+    
+    Returns:
+        The text the time item shows now, or None without a current time line
     """
     if not current_time_objects or len(current_time_objects) != 2:
-        return
+        return None
     
     # Calculate new position
-    current_minutes = current_time.hour * 60 + current_time.minute + current_time.second / 60.0
-    start_minutes = start_hour * 60
-    y = ((current_minutes - start_minutes) / 60) * pixels_per_hour + 100 + offset_y
+    seconds_since_start = (current_time.hour - start_hour) * 3600 + current_time.minute * 60 + current_time.second
+    y = seconds_since_start * pixels_per_hour // 3600 + 100 + offset_y
     
     # Reposition line
     line = current_time_objects[0]
@@ -73,34 +122,26 @@ def reposition_current_time_line(canvas: Canvas, current_time_objects, start_hou
     
     # Reposition and update text
     text = current_time_objects[1]
-    time_format = "%H:%M:%S" if mouse_inside_window else "%H:%M"
-    time_text = current_time.strftime(time_format)
+    time_text = _format_current_time(current_time, mouse_inside_window)
     # Position text on the right side with some padding from the edge
     text_x = width - 5
     canvas.coords(text, text_x, y)
-    canvas.itemconfig(text, text=time_text)
+    # Ticks are more frequent than the text changes when seconds are not shown
+    if shown_text != time_text:
+        canvas.itemconfig(text, text=time_text)
+    return time_text
 
 # Reposition of all timeline elements after pixels per hour change or width change
 def reposition_timeline(canvas: Canvas, created_objects, pixels_per_hour: int, offset_y: int, width: int, granularity: int):
     """Reposition all timeline elements after pixels per hour change or width change."""
-    # For 60m granularity, objects are [line, text, line, text, ...]
-    # For 5m granularity, objects are [line, text, line, text, ...] but not every line has a text
-    minute = 0
-    obj_idx = 0
-    total_objects = len(created_objects)
-    while obj_idx < total_objects:
-        obj = created_objects[obj_idx]
-        coords = canvas.coords(obj)
-        y = (minute / 60) * pixels_per_hour + 100 + offset_y
-        if len(coords) == 4:  # Line object
-            canvas.coords(obj, 0, y, width, y)
-            obj_idx += 1
-            # Check if next object is a text for this line
-            if obj_idx < total_objects:
-                next_obj = created_objects[obj_idx]
-                next_coords = canvas.coords(next_obj)
-                if len(next_coords) == 2:
-                    # This is a text object
-                    canvas.coords(next_obj, coords[0] if granularity == 60 and minute % 60 == 0 else (36 if granularity < 60 and minute % 60 != 0 else 5), y)
-                    obj_idx += 1
-        minute += granularity
+    # The layout of created_objects is fixed by draw_timeline:
+    # [hour lines, minute lines (if granularity < 60), one text per step...],
+    # so item kinds follow from the position and never need to be queried from Tk
+    ys = _timeline_ys(pixels_per_hour, offset_y, granularity)
+    grid_ys = _split_grid_ys(ys, granularity)
+    grid_count = 1 if granularity >= 60 else 2
+    for obj, line_ys in zip(created_objects[:grid_count], grid_ys):
+        canvas.coords(obj, *_grid_line_coords(line_ys, width))
+    steps_per_hour = 60 // granularity
+    for index, (obj, y) in enumerate(zip(created_objects[grid_count:], ys)):
+        canvas.coords(obj, MINUTE_TEXT_X if index % steps_per_hour else HOUR_TEXT_X, y)
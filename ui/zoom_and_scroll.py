@@ -1,26 +1,19 @@
 from utils.logging import log_debug
 from ui.timeline import reposition_timeline, reposition_current_time_line
-from utils.time_utils import get_current_activity
 from datetime import datetime
-import tkinter.font as tkfont
+from constants import UIConstants
 
 
 def _update_activity_label_truncation(app):
     """Update activity label text with truncation based on current window width."""
     # Import here to avoid circular dependency
-    from ui.app_ui_loop import truncate_text_to_width
+    from ui.app_ui_loop import set_activity_label_text
     
     # Only update if we have stored full text
     if not hasattr(app, '_activity_label_full_text'):
         return
     
-    full_text = app._activity_label_full_text
-    label_font = tkfont.Font(font=app.activity_label['font'])
-    label_width = app.activity_label.winfo_width()
-    # Account for padding and border (approx 10px on each side)
-    available_width = max(label_width - 20, 50)
-    truncated_text = truncate_text_to_width(full_text, label_font, available_width)
-    app.activity_label.config(text=truncated_text)
+    set_activity_label_text(app, app._activity_label_full_text)
 
 
 def move_timelines_and_cards(app, delta_y):
@@ -30,38 +23,18 @@ def move_timelines_and_cards(app, delta_y):
     which makes scrolling fast and smooth. Visual updates (colors, text, progress bars)
     are handled by the regular UI update loop.
     """
-    for tid in getattr(app, 'timeline_1h_ids', []):
-        app.canvas.move(tid, 0, delta_y)
-    for tid in getattr(app, 'timeline_5m_ids', []):
-        app.canvas.move(tid, 0, delta_y)
-    # Move current time line
-    for tid in getattr(app, 'current_time_ids', []):
-        app.canvas.move(tid, 0, delta_y)
+    # Timelines, current time line and every card item share one tag,
+    # so a single Tk call moves them all
+    app.canvas.move(UIConstants.SCROLLABLE_TAG, 0, delta_y)
 
-    now = app.now_provider()
-    current_activity = get_current_activity(app.schedule, now)
-    # Move all cards and their associated canvas items
+    # Scrolling is a pure translation, so only the cached card positions change
     for card_obj in app.cards:
         card_obj.y += delta_y
-        # Move all card canvas items (card, label, progress, time labels, task count)
-        for cid in [card_obj.card, card_obj.label, 
-                    getattr(card_obj, 'progress', None),
-                    getattr(card_obj, 'time_start_label', None),
-                    getattr(card_obj, 'time_end_label', None),
-                    getattr(card_obj, 'tasks_count_label', None)]:
-            if cid:
-                app.canvas.move(cid, 0, delta_y)
-            
-            # If card is the same as current_card or have progress bar - update its visuals
-            if card_obj.activity == current_activity or getattr(card_obj, 'progress', None):
-                card_obj.update_card_visuals(
-                    card_obj.start_hour, card_obj.start_minute, app.start_hour, app.pixels_per_hour, app.offset_y, now=now.time(), width=app.winfo_width()
-                )
 
 
 def is_mouse_in_window(app):
     """Check if mouse is in the window."""
-    x, y = app.winfo_pointerx(), app.winfo_pointery()
+    x, y = app.winfo_pointerxy()
     x0, y0 = app.winfo_rootx(), app.winfo_rooty()
     x1, y1 = x0 + app.winfo_width(), y0 + app.winfo_height()
     menu_bar_height = 30 if app.menu_visible else 0
@@ -73,45 +46,110 @@ def poll_mouse(app):
     from ui.app_ui_events import hide_menu_bar
     if app.menu_visible and not is_mouse_in_window(app):
         hide_menu_bar(app)
-    app.after(200, lambda: poll_mouse(app))
+    app.after(_mouse_poll_delay_ms(app), lambda: poll_mouse(app))
+
+def _mouse_poll_delay_ms(app) -> int:
+    """Delay until the next poll_mouse run, longer the longer the user is idle."""
+    # A visible menu bar must be hidden promptly once the mouse leaves
+    if app.menu_visible:
+        return UIConstants.MOUSE_POLL_INTERVAL_MS
+    idle_seconds = (datetime.now() - app.last_action).total_seconds()
+    if idle_seconds < UIConstants.MOUSE_POLL_IDLE_SEC:
+        return UIConstants.MOUSE_POLL_INTERVAL_MS
+    if idle_seconds < UIConstants.MOUSE_POLL_LONG_IDLE_SEC:
+        return UIConstants.MOUSE_POLL_IDLE_INTERVAL_MS
+    return UIConstants.MOUSE_POLL_LONG_IDLE_INTERVAL_MS
 
 def zoom(app, event, delta: int):
     """Zoom in or out based on mouse wheel event."""
     zoom_step = 0.1
     a = app.zoom_factor + (-zoom_step if delta > 0 else zoom_step)
-    app.zoom_factor = max(0.5, min(6, a))
+    zoom_factor = max(0.5, min(6, a))
+    # Already at a zoom limit
+    if zoom_factor == app.zoom_factor:
+        return
+    app.zoom_factor = zoom_factor
     old_pph = app.pixels_per_hour
+    old_offset_y = app.offset_y
     app.pixels_per_hour = max(50, int(50 * app.zoom_factor))
     mouse_y = event.y
     rel_y = mouse_y - 100 - app.offset_y
     scale = app.pixels_per_hour / old_pph
     app.offset_y = min(100, int(mouse_y - 100 - rel_y * scale))
-    resize_timelines_and_cards(app)
     app.last_action = datetime.now()
+    # A step below one pixel per hour changes nothing
+    if app.pixels_per_hour == old_pph and app.offset_y == old_offset_y:
+        return
+    app._pending_zoom = True
+    _schedule_view_update(app)
+
+def _schedule_view_update(app):
+    """Apply pending zoom/scroll changes once Tk is idle.
+
+    A fast wheel spin delivers many events before the canvas is redrawn. Each
+    event only updates pixels_per_hour/offset_y; the canvas work runs once.
+    """
+    if not app._view_update_scheduled:
+        app._view_update_scheduled = True
+        app.after_idle(flush_view_update, app)
+
+def flush_view_update(app):
+    """Bring the canvas in line with pending zoom/scroll changes right away.
+
+    Called from the idle callback and by code that needs card positions to
+    match offset_y before it continues (UI loop tick, card press).
+    """
+    app._view_update_scheduled = False
+    if app._pending_zoom:
+        app._pending_zoom = False
+        # Absolute relayout, also absorbs any pending scroll
+        resize_timelines_and_cards(app)
+    if app._pending_scroll_dy:
+        delta_y = app._pending_scroll_dy
+        app._pending_scroll_dy = 0
+        move_timelines_and_cards(app, delta_y)
 
 def resize_timelines_and_cards(app):
     """Resize timelines and cards based on new PPH and offset Y."""
-    log_debug(f"Resizing timelines and cards, new PPH: {app.pixels_per_hour}, Offset Y: {app.offset_y}")
+    log_debug("Resizing timelines and cards, new PPH: %s, Offset Y: %s", app.pixels_per_hour, app.offset_y)
+    # Each winfo_width() is a Tcl round-trip; the width cannot change during this call
+    width = app.winfo_width()
+    # Height-only window resizes do not change the layout
+    resize_state = (app.pixels_per_hour, app.offset_y, width, app.start_hour)
+    if resize_state == app._last_resize_state:
+        return
+    app._last_resize_state = resize_state
+    # Everything below is placed for the current offset_y
+    app._pending_scroll_dy = 0
     now = app.now_provider().time()
     for card_obj in app.cards:
         card_obj.update_card_visuals(
-            card_obj.start_hour, card_obj.start_minute, app.start_hour, app.pixels_per_hour, app.offset_y, now=now, width=app.winfo_width()
+            card_obj.start_hour, card_obj.start_minute, app.start_hour, app.pixels_per_hour, app.offset_y, now=now, width=width
         )
-    reposition_timeline(app.canvas, app.timeline_1h_ids, app.pixels_per_hour, app.offset_y, app.winfo_width(), granularity=60)
-    reposition_timeline(app.canvas, app.timeline_5m_ids, app.pixels_per_hour, app.offset_y, app.winfo_width(), granularity=5)
+    # Only the visible timeline is laid out now; the hidden one (hundreds of
+    # items at 5 minute granularity) is laid out by show_timeline when shown
+    for granularity, timeline_ids in ((60, app.timeline_1h_ids), (5, app.timeline_5m_ids)):
+        if granularity == app.timeline_granularity:
+            reposition_timeline(app.canvas, timeline_ids, app.pixels_per_hour, app.offset_y, width, granularity=granularity)
+        else:
+            app._stale_timeline_granularities.add(granularity)
     # Reposition current time line
     mouse_inside = app._is_mouse_inside_window()
-    reposition_current_time_line(app.canvas, app.current_time_ids, app.start_hour, app.pixels_per_hour, app.offset_y, app.winfo_width(), now, mouse_inside)
-    app.activity_label.place(x=10, y=40, width=app.winfo_width() - 20)
+    app.current_time_text = reposition_current_time_line(
+        app.canvas, app.current_time_ids, app.start_hour, app.pixels_per_hour, app.offset_y, width, now, mouse_inside,
+        shown_text=app.current_time_text
+    )
+    app.activity_label.place(x=10, y=40, width=width - 20)
     
     # Recalculate text truncation on resize
     _update_activity_label_truncation(app)
     
 def scroll(app, event, delta: int):
     """Scroll timelines and cards based on scroll event."""
-    log_debug(f"Scrolling: {delta}, PPH: {app.pixels_per_hour}, Current Offset Y: {app.offset_y}")
+    log_debug("Scrolling: %s, PPH: %s, Current Offset Y: %s", delta, app.pixels_per_hour, app.offset_y)
     if app.pixels_per_hour > 50:
         scroll_step = -40 if delta > 0 else 40
         app.offset_y += scroll_step
-        move_timelines_and_cards(app, scroll_step)
+        app._pending_scroll_dy += scroll_step
+        _schedule_view_update(app)
         app.last_action = datetime.now()
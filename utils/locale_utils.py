@@ -1,5 +1,5 @@
-from typing import List
-from utils.translator import get_value
+from typing import Any, Dict, List, Tuple
+from utils.translator import get_translator, get_value
 
 # Default English fallback (Monday-first)
 _DEFAULT_WEEKDAYS: List[str] = [
@@ -22,20 +22,32 @@ _DEFAULT_WEEKDAYS_SHORT: List[str] = [
     "Sun",
 ]
 
+# Validated weekday lists by translation key, with the translations dict they
+# were read from; a language change replaces that dict and so the entry
+_weekday_cache: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}
+
+
+def _get_weekday_list(key: str, default: List[str]) -> List[str]:
+    """Return the 7-name list stored under key, or default if it is missing or malformed."""
+    translations = get_translator().translations
+    cached = _weekday_cache.get(key)
+    if cached is not None and cached[0] is translations:
+        return cached[1]
+    val = get_value(key)
+    if not (isinstance(val, list) and len(val) == 7 and all(isinstance(x, str) for x in val)):
+        val = default
+    _weekday_cache[key] = (translations, val)
+    return val
+
+
 def get_weekdays() -> List[str]:
     """Return localized weekday names (Monday-first), falling back to English."""
-    val = get_value("datetime.weekdays")
-    if isinstance(val, list) and len(val) == 7 and all(isinstance(x, str) for x in val):
-        return val
-    return _DEFAULT_WEEKDAYS
+    return _get_weekday_list("datetime.weekdays", _DEFAULT_WEEKDAYS)
 
 
 def get_weekdays_short() -> List[str]:
     """Return localized short weekday names (Mon-first), falling back to English."""
-    val = get_value("datetime.weekdays_short")
-    if isinstance(val, list) and len(val) == 7 and all(isinstance(x, str) for x in val):
-        return val
-    return _DEFAULT_WEEKDAYS_SHORT
+    return _get_weekday_list("datetime.weekdays_short", _DEFAULT_WEEKDAYS_SHORT)
 
 
 def get_weekday_name(index: int) -> str:
@@ -1,3 +1,4 @@
+import atexit
 import os
 import traceback
 from datetime import datetime
@@ -16,9 +17,19 @@ logtarget = logtarget_console
 loglevel = loglevel_info
 logfile = "app.log"
 logfile_handle = None
+# Log file write buffer; warnings and errors are flushed right away
+LOGFILE_BUFFER_SIZE = 65536
 
 logging_start_time = datetime.now()
 
+_level_names = {
+    loglevel_debug: "DBG",
+    loglevel_info: "INF",
+    loglevel_warning: "WRN",
+    loglevel_error: "ERR",
+    loglevel_critical: "CRI",
+}
+
 def loglevel_to_string(level: int) -> str:
     """
     Converts a log level integer to its string representation.
@@ -29,34 +40,28 @@ def loglevel_to_string(level: int) -> str:
     Returns:
         str: The string representation of the log level.
     """
-    if level == loglevel_debug:
-        return "DBG"
-    elif level == loglevel_info:
-        return "INF"
-    elif level == loglevel_warning:
-        return "WRN"
-    elif level == loglevel_error:
-        return "ERR"
-    elif level == loglevel_critical:
-        return "CRI"
-    else:
-        return "UNK"
+    return _level_names.get(level, "UNK")
 
-def log(message: str, level: int = loglevel_info):
+def log(message: str, *args, level: int = loglevel_info):
     """
     Logs a message to a specified file with a given log level.
 
     Args:
-        message (str): The message to log.
+        message (str): The message to log, %-style format string when args are given.
+        args: Values formatted into message, only when the message is actually logged.
         level (int): The log level (e.g., loglevel_info, loglevel_debug, loglevel_error).
     """
     if level < loglevel:
         return
+    if args:
+        message = message % args
     
-    time_since_start = datetime.now() - logging_start_time
+    # One clock read serves both the timestamp and the time since start
+    now = datetime.now()
+    time_since_start = now - logging_start_time
 
     # Format the message with a timestamp
-    log_message = f"{datetime.now().strftime('%y%m%d %H%M%S')} {time_since_start.total_seconds():<.3f} [{loglevel_to_string(level)}]: {message}"
+    log_message = f"{now.strftime('%y%m%d %H%M%S')} {time_since_start.total_seconds():<.3f} [{_level_names.get(level, 'UNK')}]: {message}"
 
     if logtarget == logtarget_console:
         print(log_message)
@@ -65,49 +70,62 @@ def log(message: str, level: int = loglevel_info):
             raise ValueError("Logfile is not set. Please set the logfile before logging.")
         global logfile_handle
         if logfile_handle is None:
-            logfile_handle = open(logfile, "a")
+            logfile_handle = open(logfile, "a", encoding="utf-8", buffering=LOGFILE_BUFFER_SIZE)
+            atexit.register(_close_logfile)
         logfile_handle.write(log_message + "\n")
+        if level >= loglevel_warning:
+            logfile_handle.flush()
 
-def log_error(message: str):
+def _close_logfile():
+    """Flush buffered log lines and close the log file, registered with atexit."""
+    global logfile_handle
+    if logfile_handle is not None:
+        logfile_handle.close()
+        logfile_handle = None
+
+def log_error(message: str, *args):
     """
     Logs an error message to a specified file.
 
     Args:
         message (str): The error message to log.
     """
-    log(message, level=loglevel_error)
+    log(message, *args, level=loglevel_error)
 
-def log_info(message: str):
+def log_info(message: str, *args):
     """
     Logs an informational message to a specified file.
     Args:
         message (str): The informational message to log.
     """
-    log(message, level=loglevel_info)
+    log(message, *args, level=loglevel_info)
 
-def log_debug(message: str):
+def log_debug(message: str, *args):
     """
     Logs a debug message to a specified file.
     Args:
         message (str): The debug message to log.
     """
-    log(message, level=loglevel_debug)
+    # Debug is off by default; skip the call into log() entirely
+    if loglevel_debug < loglevel:
+        return
+    log(message, *args, level=loglevel_debug)
 
-def log_warning(message: str):
+def log_warning(message: str, *args):
     """
     Logs a warning message to a specified file.
     Args:
         message (str): The warning message to log.
     """
-    log(message, level=loglevel_warning)
+    log(message, *args, level=loglevel_warning)
 
-def log_critical(message: str):
+def log_critical(message: str, *args):
     """
     Logs a critical message to a specified file.
     Args:
         message (str): The critical message to log.
     """
-    log(message, level=loglevel_critical)
+    log(message, *args, level=loglevel_critical)
 
 def log_exception(exception: Exception):
     """
@@ -180,54 +198,64 @@ def setup_logging_file(file: str = "app.log", level: int = loglevel_info):
     ensure_log_directory(file)
     log_info("File logging setup complete.")
 
+_level_by_name = {
+    "DEBUG": loglevel_debug,
+    "INFO": loglevel_info,
+    "WARNING": loglevel_warning,
+    "ERROR": loglevel_error,
+    "CRITICAL": loglevel_critical,
+}
+
+def _option_value(argv, option: str):
+    """
+    Returns the value following option in argv.
+
+    Returns:
+        None if option is not given, "" if it is the last argument.
+    """
+    try:
+        idx = argv.index(option)
+    except ValueError:
+        return None
+    return argv[idx + 1] if idx + 1 < len(argv) else ""
+
 def log_startup():
     """
     Setup loging using argc and argv if provided.
     """
     file = "app.log"
     level = loglevel_info
+    argv = os.sys.argv
 
-    if "--log-file" in os.sys.argv:
-        idx = os.sys.argv.index("--log-file")
-        if idx + 1 < len(os.sys.argv):
-            file = os.sys.argv[idx + 1]
+    log_file = _option_value(argv, "--log-file")
+    if log_file is not None:
+        if log_file:
+            file = log_file
         if not file.endswith(".log"):
             file += ".log"
 
     # Check for command line arguments to set log level
-    if "--log-level" in os.sys.argv:
-        idx = os.sys.argv.index("--log-level")
-        if idx + 1 < len(os.sys.argv):
-            level_str = os.sys.argv[idx + 1].upper()
-            if level_str in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-                if level_str == "DEBUG":
-                    level = loglevel_debug
-                elif level_str == "INFO":
-                    level = loglevel_info
-                elif level_str == "WARNING":
-                    level = loglevel_warning
-                elif level_str == "ERROR":
-                    level = loglevel_error
-                elif level_str == "CRITICAL":
-                    level = loglevel_critical
-            else:
-                raise ValueError(f"Invalid log level: {level_str}")
-        else:
+    level_arg = _option_value(argv, "--log-level")
+    if level_arg is not None:
+        if not level_arg:
             raise ValueError("No log level provided after --log-level")
+        level_str = level_arg.upper()
+        if level_str not in _level_by_name:
+            raise ValueError(f"Invalid log level: {level_str}")
+        level = _level_by_name[level_str]
 
     global logtarget
-    if "--log-target" in os.sys.argv:
-        idx = os.sys.argv.index("--log-target")
-        if idx + 1 < len(os.sys.argv):
-            target_str = os.sys.argv[idx + 1].lower()
-            if target_str == "file":
-                logtarget = logtarget_file
-            elif target_str == "console":
-                logtarget = logtarget_console
-            else:
-                raise ValueError(f"Invalid log target: {target_str}")
-        else:
+    target_arg = _option_value(argv, "--log-target")
+    if target_arg is not None:
+        if not target_arg:
             raise ValueError("No log target provided after --log-target")
+        target_str = target_arg.lower()
+        if target_str == "file":
+            logtarget = logtarget_file
+        elif target_str == "console":
+            logtarget = logtarget_console
+        else:
+            raise ValueError(f"Invalid log target: {target_str}")
 
     if logtarget == logtarget_file:
         setup_logging_file(file, level)
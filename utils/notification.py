@@ -4,6 +4,21 @@ from utils.logging import log_info, log_error, log_debug
 
 gotify_token = None  # Replace with your Gotify token
 gotify_url = None  # Replace with your Gotify server URL
+# Request headers for gotify_token, rebuilt by configure_gotify
+_headers = {"X-Gotify-Key": gotify_token, "Content-Type": "application/json"}
+
+# Keep-alive connection pool shared by all notifications, so only the first
+# one to a server pays for the TCP/TLS handshake
+_session = requests.Session()
+# Seconds to wait for the Gotify server before giving up on a notification
+GOTIFY_TIMEOUT_SECONDS = 5
+
+def configure_gotify(url: str, token: str) -> None:
+    """Set the Gotify server URL and token used by send_gotify_notification."""
+    global gotify_url, gotify_token, _headers
+    gotify_url = url
+    gotify_token = token
+    _headers = {"X-Gotify-Key": token, "Content-Type": "application/json"}
 
 def format_gotify_message(activity: Dict) -> str:
     """Format a message for Gotify notification."""
@@ -21,16 +36,11 @@ def send_gotify_notification(activity: Dict, is_delayed: bool = False) -> None:
         "title": f"{'Starting: ' if not is_delayed else ''}{activity['name']}",
         "message": message or "No description provided"
     }
-    
-    headers = {
-        "X-Gotify-Key": gotify_token,
-        "Content-Type": "application/json"
-    }
 
-    log_debug(f"Sending notification: {payload} to {gotify_url}")
-    response = requests.post(gotify_url, json=payload, headers=headers)
+    log_debug("Sending notification: %s to %s", payload, gotify_url)
+    response = _session.post(gotify_url, json=payload, headers=_headers, timeout=GOTIFY_TIMEOUT_SECONDS)
 
     if response.status_code != 200:
-        log_error(f"Failed to send notification: {response.status_code} - {response.text}")
+        log_error("Failed to send notification: %s - %s", response.status_code, response.text)
     else:
         log_info("Notification sent successfully.")
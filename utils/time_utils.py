@@ -1,7 +1,19 @@
-from datetime import datetime, time, timedelta, date
+import re
+from datetime import datetime, time, date
 from typing import Dict, List, Optional, Any, Tuple
 from constants import ValidationConstants
 
+# Parsed results of parse_time_with_validation, keyed by the raw string.
+# Schedules reuse a small set of time strings, so this stays small; the
+# size cap only guards against unbounded growth.
+_PARSE_CACHE: Dict[str, time] = {}
+_PARSE_CACHE_MAX_SIZE = 4096
+# Same strings as seconds since midnight, for integer range checks
+_SECONDS_CACHE: Dict[str, int] = {}
+# 'HH:MM' or 'HH:MM:SS' with plain ASCII digits, the form schedules use;
+# the range checks in _parse_time bound the values
+_TIME_RE = re.compile(r"([0-9]+):([0-9]+)(?::([0-9]+))?")
+
 
 class TimeUtils:
     """Consolidated time utilities for parsing, validation, and formatting."""
@@ -23,45 +35,82 @@ class TimeUtils:
         if not isinstance(time_str, str):
             raise ValueError(f"Time must be a string, got {type(time_str)}")
         
+        parsed = _PARSE_CACHE.get(time_str)
+        if parsed is None:
+            parsed = TimeUtils._parse_time(time_str)
+            if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX_SIZE:
+                _PARSE_CACHE.clear()
+            _PARSE_CACHE[time_str] = parsed
+        return parsed
+    
+    @staticmethod
+    def _parse_time(time_str: str) -> time:
+        """Parse and validate a time string, see parse_time_with_validation."""
         time_str = time_str.strip()
         if not time_str:
             raise ValueError("Time string cannot be empty")
         
-        parts = time_str.split(":")
-        
-        try:
-            if len(parts) == 2:
-                hour, minute = int(parts[0]), int(parts[1])
-                second = 0
-            elif len(parts) == 3:
-                hour, minute, second = int(parts[0]), int(parts[1]), int(parts[2])
-            else:
+        match = _TIME_RE.fullmatch(time_str)
+        if match is not None:
+            hour, minute, second = int(match[1]), int(match[2]), int(match[3] or 0)
+        else:
+            # Anything else int() accepts (signs, inner spaces, other digits) stays valid
+            parts = time_str.split(":")
+            if len(parts) not in (2, 3):
                 raise ValueError(f"Invalid time format: {time_str}. Expected 'HH:MM' or 'HH:MM:SS'")
-            
-            # Validate ranges
-            if not (ValidationConstants.MIN_HOUR <= hour <= ValidationConstants.MAX_HOUR):
-                raise ValueError(f"Hour {hour} out of range ({ValidationConstants.MIN_HOUR}-{ValidationConstants.MAX_HOUR})")
-            if not (ValidationConstants.MIN_MINUTE <= minute <= ValidationConstants.MAX_MINUTE):
-                raise ValueError(f"Minute {minute} out of range ({ValidationConstants.MIN_MINUTE}-{ValidationConstants.MAX_MINUTE})")
-            if not (0 <= second <= 59):
-                raise ValueError(f"Second {second} out of range (0-59)")
-            
-            return time(hour, minute, second)
-            
-        except ValueError as e:
-            if "invalid literal" in str(e):
+            try:
+                hour, minute, second = (int(part) for part in parts + ["0"] * (3 - len(parts)))
+            except ValueError:
                 raise ValueError(f"Invalid time format: {time_str}. All parts must be numbers")
-            raise
+        
+        # Validate ranges
+        if not (ValidationConstants.MIN_HOUR <= hour <= ValidationConstants.MAX_HOUR):
+            raise ValueError(f"Hour {hour} out of range ({ValidationConstants.MIN_HOUR}-{ValidationConstants.MAX_HOUR})")
+        if not (ValidationConstants.MIN_MINUTE <= minute <= ValidationConstants.MAX_MINUTE):
+            raise ValueError(f"Minute {minute} out of range ({ValidationConstants.MIN_MINUTE}-{ValidationConstants.MAX_MINUTE})")
+        if not (0 <= second <= 59):
+            raise ValueError(f"Second {second} out of range (0-59)")
+        
+        return time(hour, minute, second)
+    
+    @staticmethod
+    def seconds_since_midnight(time_str: str) -> int:
+        """
+        Parse a time string like parse_time_with_validation, as seconds since midnight.
+        
+        Raises:
+            ValueError: If time string is invalid or out of range
+        """
+        seconds = _SECONDS_CACHE.get(time_str)
+        if seconds is None:
+            parsed = TimeUtils.parse_time_with_validation(time_str)
+            seconds = parsed.hour * 3600 + parsed.minute * 60 + parsed.second
+            if len(_SECONDS_CACHE) >= _PARSE_CACHE_MAX_SIZE:
+                _SECONDS_CACHE.clear()
+            _SECONDS_CACHE[time_str] = seconds
+        return seconds
+    
+    @staticmethod
+    def is_seconds_in_range(now_seconds: int, start_seconds: int, end_seconds: int) -> bool:
+        """
+        Integer form of is_time_in_range, all arguments in seconds since midnight.
+        
+        Whole seconds are enough: range bounds never carry microseconds.
+        """
+        if end_seconds < start_seconds:
+            # Range crosses midnight
+            return now_seconds >= start_seconds or now_seconds < end_seconds
+        return start_seconds <= now_seconds < end_seconds
     
     @staticmethod
     def format_time_display(t: time) -> str:
         """Format a time object to HH:MM string for display."""
-        return t.strftime("%H:%M")
+        return f"{t.hour:02d}:{t.minute:02d}"
     
     @staticmethod
     def format_time_with_seconds(t: time) -> str:
         """Format a time object to HH:MM:SS string."""
-        return t.strftime("%H:%M:%S")
+        return f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
     
     @staticmethod
     def calculate_duration_minutes(start_time_str: str, end_time_str: str) -> int:
@@ -75,12 +124,9 @@ class TimeUtils:
         Returns:
             Duration in minutes
         """
-        start_time = TimeUtils.parse_time_with_validation(start_time_str)
-        end_time = TimeUtils.parse_time_with_validation(end_time_str)
-        
-        # Convert to minutes since midnight
-        start_minutes = start_time.hour * 60 + start_time.minute
-        end_minutes = end_time.hour * 60 + end_time.minute
+        # Minutes since midnight, from the cached per-string seconds
+        start_minutes = TimeUtils.seconds_since_midnight(start_time_str) // 60
+        end_minutes = TimeUtils.seconds_since_midnight(end_time_str) // 60
         
         # Handle case where end time is next day (e.g., 23:00 to 01:00)
         if end_minutes < start_minutes:
@@ -91,7 +137,9 @@ class TimeUtils:
     @staticmethod
     def round_to_nearest_5_minutes(minutes: int) -> int:
         """Round minutes to the nearest 5 minutes."""
-        return ValidationConstants.TIME_ROUNDING_MINUTES * round(minutes / ValidationConstants.TIME_ROUNDING_MINUTES)
+        # Integer-only equivalent of step * round(minutes / step); whole minutes never tie
+        step = ValidationConstants.TIME_ROUNDING_MINUTES
+        return ((minutes + step // 2) // step) * step
     
     @staticmethod
     def normalize_time_format(timepoint: datetime) -> str:
@@ -104,16 +152,9 @@ class TimeUtils:
         Returns:
             Normalized time string in HH:MM format
         """
-        hour = timepoint.hour
-        minutes = TimeUtils.round_to_nearest_5_minutes(timepoint.minute)
-        
-        if minutes == 60:
-            hour += 1
-            minutes = 0
-        if hour >= 24:
-            hour = 0
-            
-        return f"{hour:02d}:{minutes:02d}"
+        # Rounding up to minute 60 carries into the hour, and 24:00 wraps to 00:00
+        total_minutes = (timepoint.hour * 60 + TimeUtils.round_to_nearest_5_minutes(timepoint.minute)) % (24 * 60)
+        return f"{total_minutes // 60:02d}:{total_minutes % 60:02d}"
     
     @staticmethod
     def is_time_in_range(current_time: time, start_time_str: str, end_time_str: str) -> bool:
@@ -129,16 +170,11 @@ class TimeUtils:
         Returns:
             True if current time is within range
         """
-        start_time = TimeUtils.parse_time_with_validation(start_time_str)
-        end_time = TimeUtils.parse_time_with_validation(end_time_str)
-        
-        # Handle activities that cross midnight
-        if end_time < start_time:
-            # Activity crosses midnight - current time is active if it's either >= start_time OR < end_time
-            return current_time >= start_time or current_time < end_time
-        else:
-            # Normal case - activity within same day
-            return start_time <= current_time < end_time
+        return TimeUtils.is_seconds_in_range(
+            current_time.hour * 3600 + current_time.minute * 60 + current_time.second,
+            TimeUtils.seconds_since_midnight(start_time_str),
+            TimeUtils.seconds_since_midnight(end_time_str)
+        )
     
     @staticmethod
     def get_logical_date(current_datetime: datetime, day_start_hour: int = 0) -> date:
@@ -168,14 +204,8 @@ class TimeUtils:
         if not (0 <= day_start_hour <= 23):
             raise ValueError(f"day_start_hour must be between 0-23, got {day_start_hour}")
         
-        current_hour = current_datetime.hour
-        current_date = current_datetime.date()
-        
         # If current hour is before day_start, we're still in the previous logical day
-        if current_hour < day_start_hour:
-            return current_date - timedelta(days=1)
-        else:
-            return current_date
+        return date.fromordinal(current_datetime.toordinal() - (current_datetime.hour < day_start_hour))
 
 
 # Backward compatibility functions - these delegate to TimeUtils methods
@@ -188,10 +218,17 @@ def get_current_activity(schedule: List[Dict[str, Any]], current_time: datetime)
         return None
     '''
     
-    time_now = current_time.time()
+    # Compare plain ints; the bounds of each activity come from a cache
+    now_seconds = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+    seconds_of = TimeUtils.seconds_since_midnight
     for activity in schedule:
-        # Use TimeUtils for consistent time parsing
-        if TimeUtils.is_time_in_range(time_now, activity["start_time"], activity["end_time"]):
+        start_seconds = seconds_of(activity["start_time"])
+        end_seconds = seconds_of(activity["end_time"])
+        # Inlined TimeUtils.is_seconds_in_range, this loop runs every UI tick
+        if end_seconds < start_seconds:
+            if now_seconds >= start_seconds or now_seconds < end_seconds:
+                return activity.copy()
+        elif start_seconds <= now_seconds < end_seconds:
             return activity.copy()
     
     return None
@@ -34,6 +34,14 @@ class Translator:
         
         self.translations = {}
         self.fallback_translations = {}
+        # Every dot-notation key of the dicts above mapped to its value, the
+        # current language over the fallback, so a lookup is a single dict access
+        self._flat_fallback_translations = {}
+        self._lookup = {}
+        # Keys already reported as missing, each is logged once
+        self._missing_keys = set()
+        # (locales_dir mtime, languages) from the last get_available_languages scan
+        self._available_languages_cache = None
         
         # Load translations
         self._load_translations()
@@ -52,6 +60,9 @@ class Translator:
             log_error(f"Failed to load language '{self.language}', falling back to '{self.fallback_language}'")
             self.translations = self.fallback_translations.copy()
             self.language = self.fallback_language
+        
+        self._flat_fallback_translations = self._flatten(self.fallback_translations)
+        self._build_lookup()
     
     def _load_language_file(self, language: str) -> Dict[str, Any]:
         """
@@ -65,15 +76,14 @@ class Translator:
         """
         file_path = os.path.join(self.locales_dir, f"{language}.json")
         
-        if not os.path.exists(file_path):
-            log_debug(f"Translation file not found: {file_path}")
-            return {}
-        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 translations = json.load(f)
-                log_info(f"Loaded translations for language: {language}")
+                log_info("Loaded translations for language: %s", language)
                 return translations
+        except FileNotFoundError:
+            log_debug("Translation file not found: %s", file_path)
+            return {}
         except (json.JSONDecodeError, IOError) as e:
             log_error(f"Failed to load translation file {file_path}: {e}")
             return {}
@@ -89,16 +99,14 @@ class Translator:
         Returns:
             Translated string, or the key itself if translation not found
         """
-        # Try to get translation from current language
-        translation = self._get_nested_value(self.translations, key)
-        
-        # Fall back to fallback language if not found
-        if translation is None and self.fallback_translations:
-            translation = self._get_nested_value(self.fallback_translations, key)
+        # Current language, or the fallback language where it has no entry
+        translation = self._lookup.get(key)
         
-        # If still not found, return the key itself as fallback
+        # If not found, return the key itself as fallback
         if translation is None:
-            log_debug(f"Translation not found for key: {key}")
+            if key not in self._missing_keys:
+                self._missing_keys.add(key)
+                log_debug("Translation not found for key: %s", key)
             return key
         
         # Apply string formatting if parameters provided
@@ -111,34 +119,38 @@ class Translator:
         
         return translation
     
-    def _get_nested_value(self, data: Dict[str, Any], key: str) -> Optional[Any]:
+    def _build_lookup(self):
+        """Merge the flattened current translations over the fallback ones."""
+        lookup = dict(self._flat_fallback_translations)
+        # A null entry falls back like a missing one
+        lookup.update((k, v) for k, v in self._flatten(self.translations).items() if v is not None)
+        self._lookup = lookup
+        self._missing_keys = set()
+
+    @staticmethod
+    def _flatten(data: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
         """
-        Get a value from nested dictionary using dot notation.
+        Map every key path of a nested dictionary to its value.
         
         Args:
-            data: Dictionary to search in
-            key: Dot-separated key (e.g., 'window.main_title')
+            data: Nested translations dictionary
+            prefix: Dot notation path of data itself, with a trailing dot
             
         Returns:
-            Value if found (can be any JSON type), None otherwise
+            Dictionary keyed by dot notation (e.g., 'window.main_title'); nested
+            dictionaries are included under their own path as well
         """
-        keys = key.split('.')
-        current = data
-        
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return None
-        
-        return current
+        flat = {}
+        for k, value in data.items():
+            path = prefix + k
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(Translator._flatten(value, path + '.'))
+        return flat
 
     def get(self, key: str) -> Optional[Any]:
         """Retrieve raw translation value (can be list, dict, string, number, etc.)."""
-        value = self._get_nested_value(self.translations, key)
-        if value is None and self.fallback_translations:
-            value = self._get_nested_value(self.fallback_translations, key)
-        return value
+        return self._lookup.get(key)
     
     def set_language(self, language: str) -> bool:
         """
@@ -162,7 +174,8 @@ class Translator:
         # Update current language and translations
         self.language = language
         self.translations = new_translations
-        log_info(f"Language changed to: {language}")
+        self._build_lookup()
+        log_info("Language changed to: %s", language)
         return True
     
     def get_available_languages(self) -> Dict[str, str]:
@@ -174,28 +187,45 @@ class Translator:
         """
         available = {}
         
-        if not os.path.exists(self.locales_dir):
+        # Adding, removing or renaming a locale file changes the directory mtime
+        try:
+            mtime_ns = os.stat(self.locales_dir).st_mtime_ns
+        except FileNotFoundError:
             return available
+        except OSError as e:
+            log_error(f"Failed to scan locales directory: {e}")
+            return available
+        cached = self._available_languages_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return dict(cached[1])
         
         try:
-            for filename in os.listdir(self.locales_dir):
-                if filename.endswith('.json'):
-                    lang_code = filename[:-5]  # Remove .json extension
-                    
-                    # Try to get language display name from the file
-                    lang_file = os.path.join(self.locales_dir, filename)
-                    try:
-                        with open(lang_file, 'r', encoding='utf-8') as f:
-                            lang_data = json.load(f)
-                            display_name = lang_data.get('_meta', {}).get('display_name', lang_code.upper())
-                            available[lang_code] = display_name
-                    except (json.JSONDecodeError, IOError):
-                        # If we can't read the file, just use the code
-                        available[lang_code] = lang_code.upper()
+            with os.scandir(self.locales_dir) as entries:
+                locale_files = [(entry.name, entry.path) for entry in entries if entry.name.endswith('.json')]
+        except FileNotFoundError:
+            return available
         except OSError as e:
             log_error(f"Failed to scan locales directory: {e}")
+            return available
+        
+        for filename, lang_file in locale_files:
+            lang_code = filename[:-5]  # Remove .json extension
+            
+            # Parse the whole file: only offer languages set_language can load
+            try:
+                with open(lang_file, 'r', encoding='utf-8') as f:
+                    lang_data = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                log_error(f"Skipping unreadable translation file {lang_file}: {e}")
+                continue
+            if not isinstance(lang_data, dict) or not lang_data:
+                log_error(f"Skipping invalid translation file {lang_file}")
+                continue
+            meta = lang_data.get('_meta', {})
+            available[lang_code] = meta.get('display_name', lang_code.upper()) if isinstance(meta, dict) else lang_code.upper()
         
-        return available
+        self._available_languages_cache = (mtime_ns, available)
+        return dict(available)
     
     def get_current_language(self) -> str:
         """Get the current language code."""